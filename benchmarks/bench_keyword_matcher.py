@@ -0,0 +1,125 @@
+"""Benchmark of the keyword matcher against the alternation regex.
+
+Times a search per traffic report for 10, 100 and 1,000 keywords, with and
+without word boundaries, and checks both give the same result.
+
+Run from the repository root:
+
+    python benchmarks/bench_keyword_matcher.py
+"""
+
+from __future__ import annotations
+
+from pathlib import Path
+from random import Random
+import sys
+from timeit import repeat
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from custom_components.trafikmeldinger.keyword_matcher import (
+    KeywordMatcher,
+    compile_any_word_regex,
+)
+
+KEYWORD_COUNTS: tuple[int, ...] = (10, 100, 1000)
+REPORTS: int = 200
+REPEAT: int = 5
+
+ROADS: tuple[str, ...] = (
+    "Motorvej E45",
+    "Motorvej E20",
+    "Holbækmotorvejen",
+    "Køge Bugt Motorvejen",
+    "Sønderjyske Motorvej",
+    "Storebæltsbroen",
+    "Øresundsbroen",
+    "Hillerødmotorvejen",
+)
+EVENTS: tuple[str, ...] = (
+    "uheld",
+    "kø",
+    "vejarbejde",
+    "spærret vognbane",
+    "genstande på vejen",
+    "langsomtkørende køretøj",
+)
+
+
+# ------------------------------------------------------------------
+def make_keywords(count: int, random: Random) -> list[str]:
+    """Place like keywords, which mostly do not occur in the reports."""
+
+    syllables: tuple[str, ...] = ("by", "lund", "rup", "sted", "høj", "holm", "vig")
+
+    return [
+        f"{random.choice(['Ny', 'Gl', 'Sønder', 'Nørre', 'Vester', 'Øster'])}"
+        f"{random.choice(syllables)}{idx}"
+        for idx in range(count)
+    ]
+
+
+# ------------------------------------------------------------------
+def make_reports(keywords: list[str], random: Random) -> list[str]:
+    """Traffic report texts, a tenth of them containing a keyword."""
+
+    reports: list[str] = []
+
+    for idx in range(REPORTS):
+        tmp_text: str = (
+            f"{random.choice(ROADS)} i retning mod {random.choice(ROADS)}: "
+            f"{random.choice(EVENTS)} ved afkørsel {random.randint(1, 60)}. "
+            "Forvent forsinkelser og kør efter forholdene."
+        )
+
+        if idx % 10 == 0:
+            tmp_text += f" Omkørsel via {random.choice(keywords)}."
+
+        reports.append(tmp_text)
+
+    return reports
+
+
+# ------------------------------------------------------------------
+def time_per_search(search, reports: list[str]) -> float:
+    """Best time in µs of a search per report."""
+
+    best: float = min(
+        repeat(
+            lambda: [search(report) for report in reports],
+            number=10,
+            repeat=REPEAT,
+        )
+    )
+    return best / (10 * len(reports)) * 1_000_000
+
+
+# ------------------------------------------------------------------
+def main() -> None:
+    """Run the benchmark."""
+
+    random: Random = Random(1)
+
+    print(f"{'keywords':>8} {'boundaries':>10} {'regex µs':>10} {'matcher µs':>11}")
+
+    for count in KEYWORD_COUNTS:
+        keywords: list[str] = make_keywords(count, random)
+        reports: list[str] = make_reports(keywords, random)
+
+        for use_word_boundaries in (True, False):
+            regex = compile_any_word_regex(keywords, use_word_boundaries)
+            matcher: KeywordMatcher = KeywordMatcher(keywords, use_word_boundaries)
+
+            assert [regex.search(report) is not None for report in reports] == [
+                matcher.search(report) for report in reports
+            ]
+
+            print(
+                f"{count:>8} {use_word_boundaries!s:>10} "
+                f"{time_per_search(regex.search, reports):>10.2f} "
+                f"{time_per_search(matcher.search, reports):>11.2f}"
+            )
+
+
+if __name__ == "__main__":
+    main()
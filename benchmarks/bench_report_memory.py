@@ -0,0 +1,139 @@
+"""Benchmark of the memory used by a 10k traffic report backlog.
+
+Compares the slotted TrafficReport model with the raw DR post dicts and the
+derived keys they used to carry. Both hold the same rendered text, and the
+posts are decoded from JSON like a fetched page.
+
+Run from the repository root:
+
+    python benchmarks/bench_report_memory.py
+"""
+
+from __future__ import annotations
+
+from datetime import UTC, datetime, timedelta
+import gc
+import json
+from pathlib import Path
+import sys
+import tracemalloc
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from custom_components.trafikmeldinger.report_model import TrafficReport
+
+REPORTS: int = 10_000
+
+
+# ------------------------------------------------------------------
+def make_payload() -> bytes:
+    """JSON of the DR posts, some of them with a reference and updates."""
+
+    now: datetime = datetime(2026, 1, 1, tzinfo=UTC)
+    posts: list[dict] = []
+
+    for idx in range(REPORTS):
+        tmp_time: str = (now - timedelta(seconds=30 * idx)).isoformat()
+        posts.append(
+            {
+                "_id": f"{idx:024x}",
+                "text": f"Motorvej E45 i retning mod Aarhus: uheld ved afkørsel {idx % 60}. Forvent forsinkelser.",
+                "reference": {"text": "Vejdirektoratet"} if idx % 3 == 0 else None,
+                "region": ("CPH", "MID-NORTH", "SOUTH")[idx % 3],
+                "type": ("PUBLIC", "PRIVATE")[idx % 2],
+                "createdTime": tmp_time,
+                "updatedTime": tmp_time,
+                "concluded": idx % 5 == 0,
+                "updates": [
+                    {"text": f"Opdatering {upd}", "createdTime": tmp_time}
+                    for upd in range(idx % 3)
+                ],
+            }
+        )
+
+    return json.dumps(posts).encode()
+
+
+# ------------------------------------------------------------------
+def rendered(post: dict) -> tuple[str, list[str], str]:
+    """Rendered text, update texts and markdown of a post."""
+
+    return (
+        post["text"][:255],
+        [update["text"] for update in post["updates"]],
+        f"#### Trafikmelding\n\n{post['text']}",
+    )
+
+
+# ------------------------------------------------------------------
+def build_dicts(payload: bytes) -> list[dict]:
+    """Raw DR post dicts with the derived keys added."""
+
+    reports: list[dict] = json.loads(payload)
+
+    for report in reports:
+        formated_text, formated_updates_text, markdown = rendered(report)
+        report["read"] = False
+        report["formated_text"] = formated_text
+        report["formated_updates_text"] = formated_updates_text
+        report["markdown"] = markdown
+
+    return reports
+
+
+# ------------------------------------------------------------------
+def build_models(payload: bytes) -> list[TrafficReport]:
+    """Slotted traffic reports, the decoded posts are dropped after ingest."""
+
+    reports: list[TrafficReport] = []
+
+    for post in json.loads(payload):
+        report: TrafficReport = TrafficReport.from_dr(post)
+        report.formated_text, report.formated_updates_text, report.markdown = rendered(
+            post
+        )
+        reports.append(report)
+
+    return reports
+
+
+# ------------------------------------------------------------------
+def retained(build, payload: bytes) -> tuple[int, int]:
+    """Retained and peak bytes allocated while building the reports."""
+
+    gc.collect()
+    tracemalloc.start()
+
+    reports = build(payload)
+    gc.collect()
+    current, peak = tracemalloc.get_traced_memory()
+
+    tracemalloc.stop()
+    del reports
+
+    return current, peak
+
+
+# ------------------------------------------------------------------
+def main() -> None:
+    """Run the benchmark."""
+
+    payload: bytes = make_payload()
+
+    # Warm up interned strings and caches, so they count for neither side
+    build_models(payload)
+    build_dicts(payload)
+
+    print(f"{REPORTS} reports")
+    print(f"{'model':>8} {'retained MiB':>13} {'bytes/report':>13} {'peak MiB':>9}")
+
+    for name, build in (("dicts", build_dicts), ("slotted", build_models)):
+        current, peak = retained(build, payload)
+        print(
+            f"{name:>8} {current / 2**20:>13.2f} {current / REPORTS:>13.0f} "
+            f"{peak / 2**20:>9.2f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,187 @@
+"""Benchmark of merging fetched traffic reports into the cached reports.
+
+Times ComponentApi.async_get_new_traffic_reports against a stubbed feed, as
+max row fetch and the backlog of posts in the feed grow. Before every timed
+refresh a few posts are updated, so the merge sees both updated and unchanged
+reports. The time includes parsing, merging, sorting, trimming and rendering.
+
+Run from the repository root:
+
+    python benchmarks/bench_report_merge.py
+"""
+
+from __future__ import annotations
+
+import asyncio
+from datetime import datetime, timedelta
+from pathlib import Path
+from random import Random
+import sys
+from tempfile import TemporaryDirectory
+from time import perf_counter
+from types import MappingProxyType
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from custom_components.trafikmeldinger.component_api import ComponentApi
+from custom_components.trafikmeldinger.const import (
+    CONF_MAX_ROW_FETCH,
+    CONF_MAX_TIME_BACK,
+    CONF_REGION,
+    CONF_REGION_ALL,
+    CONF_TRANSPORT_TYPE,
+    CONF_TRANSPORT_TYPE_ALL,
+    DOMAIN,
+)
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import HomeAssistant
+from homeassistant.util import dt as dt_util
+
+MAX_ROW_FETCH: tuple[int, ...] = (40, 100, 200, 400)
+BACKLOG: tuple[int, ...] = (500, 2000, 10000)
+PAGE_SIZE: int = 50
+UPDATES: int = 5
+REFRESHES: int = 20
+
+
+# ------------------------------------------------------------------
+class FakeFeed:
+    """Backlog of DR posts, paged by lastPostDate like the posts endpoint."""
+
+    def __init__(self, backlog: int) -> None:
+        """Init."""
+
+        self.random: Random = Random(1)
+        self.now: datetime = dt_util.utcnow() - timedelta(hours=1)
+        self.posts: list[dict] = []
+        self.page_start: dict[str, int] = {"": 0}
+        self.fetched: int = 0
+
+        # Newest first, all within max time back
+        for idx in range(backlog):
+            tmp_time: str = (self.now - timedelta(seconds=5 * (idx + 1))).isoformat()
+            self.posts.append(
+                {
+                    "_id": f"{idx:024x}",
+                    "text": f"Motorvej E45 i retning mod Aarhus: uheld ved afkørsel {idx % 60}.",
+                    "reference": None,
+                    "region": ("CPH", "MID-NORTH", "SOUTH")[idx % 3],
+                    "type": ("PUBLIC", "PRIVATE")[idx % 2],
+                    "createdTime": tmp_time,
+                    "updatedTime": tmp_time,
+                    "concluded": False,
+                    "updates": [],
+                }
+            )
+            self.page_start[tmp_time] = idx + 1
+
+    # ------------------------------------------------------------------
+    def update(self, within: int) -> None:
+        """Update some of the newest posts."""
+
+        for post in self.random.sample(self.posts[:within], UPDATES):
+            self.now += timedelta(seconds=1)
+            post["updatedTime"] = self.now.isoformat()
+            post["updates"] = [
+                {"text": "Opdatering", "createdTime": post["updatedTime"]},
+                *post["updates"],
+            ]
+
+    # ------------------------------------------------------------------
+    async def async_get(self, url: str, conditional: bool = False) -> list:
+        """Page of posts created before lastPostDate."""
+
+        start: int = self.page_start[url.rsplit("lastPostDate=", 1)[1]]
+        page: list[dict] = self.posts[start : start + PAGE_SIZE]
+        self.fetched += len(page)
+
+        return page
+
+
+# ------------------------------------------------------------------
+def make_entry(max_row_fetch: int) -> ConfigEntry:
+    """Config entry for all regions and transport types."""
+
+    return ConfigEntry(
+        data={},
+        discovery_keys=MappingProxyType({}),
+        domain=DOMAIN,
+        minor_version=1,
+        options={
+            CONF_REGION: [CONF_REGION_ALL],
+            CONF_TRANSPORT_TYPE: [CONF_TRANSPORT_TYPE_ALL],
+            CONF_MAX_ROW_FETCH: max_row_fetch,
+            CONF_MAX_TIME_BACK: 24,
+        },
+        source="user",
+        subentries_data=None,
+        title=DOMAIN,
+        unique_id=None,
+        version=1,
+    )
+
+
+# ------------------------------------------------------------------
+async def async_time_refreshes(
+    hass: HomeAssistant, max_row_fetch: int, backlog: int
+) -> tuple[float, float]:
+    """Best time in ms per refresh and µs per fetched report."""
+
+    component_api: ComponentApi = ComponentApi(hass, make_entry(max_row_fetch), None)
+    feed: FakeFeed = FakeFeed(backlog)
+    component_api.async_get_json = feed.async_get
+
+    # Fills the cache and the render cache
+    await component_api.async_get_new_traffic_reports()
+
+    best_refresh: float = float("inf")
+    best_report: float = float("inf")
+
+    for _ in range(REFRESHES):
+        feed.update(max_row_fetch)
+        feed.fetched = 0
+
+        start: float = perf_counter()
+        await component_api.async_get_new_traffic_reports()
+        tmp_elapsed: float = perf_counter() - start
+
+        best_refresh = min(best_refresh, tmp_elapsed)
+        best_report = min(best_report, tmp_elapsed / feed.fetched)
+
+    return best_refresh * 1000, best_report * 1_000_000
+
+
+# ------------------------------------------------------------------
+async def async_main() -> None:
+    """Run the benchmark."""
+
+    with TemporaryDirectory() as config_dir:
+        hass: HomeAssistant = HomeAssistant(config_dir)
+
+        try:
+            print(
+                f"{'max rows':>8} {'backlog':>8} {'ms/refresh':>11} {'µs/report':>10}"
+            )
+
+            for max_row_fetch in MAX_ROW_FETCH:
+                for backlog in BACKLOG:
+                    tmp_refresh, tmp_report = await async_time_refreshes(
+                        hass, max_row_fetch, backlog
+                    )
+                    print(
+                        f"{max_row_fetch:>8} {backlog:>8} "
+                        f"{tmp_refresh:>11.2f} {tmp_report:>10.2f}"
+                    )
+        finally:
+            await hass.async_stop(force=True)
+
+
+# ------------------------------------------------------------------
+def main() -> None:
+    """Run the benchmark."""
+
+    asyncio.run(async_main())
+
+
+if __name__ == "__main__":
+    main()
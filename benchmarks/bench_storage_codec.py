@@ -0,0 +1,140 @@
+"""Benchmark of encoding and decoding the traffic storage.
+
+Compares the declared storage fields, serialized with orjson, with the
+jsonpickle path used by StorageJson subclasses without declared fields. The
+storage holds the last id per traffic report, a notice id and a counter.
+
+Run from the repository root:
+
+    python benchmarks/bench_storage_codec.py
+"""
+
+from __future__ import annotations
+
+import asyncio
+from pathlib import Path
+import sys
+from tempfile import TemporaryDirectory
+from timeit import repeat
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from custom_components.trafikmeldinger.component_api import TrafficStorage
+from custom_components.trafikmeldinger.hass_util.storage_json import StorageJson
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers.json import json_bytes
+from homeassistant.util.json import json_loads
+
+LAST_IDS: tuple[int, ...] = (10, 100, 1000)
+NUMBER: int = 200
+REPEAT: int = 5
+
+
+# ------------------------------------------------------------------
+class PickledTrafficStorage(StorageJson):
+    """Traffic storage without declared fields, stored with jsonpickle."""
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Init."""
+
+        super().__init__(hass, "bench_pickled_storage")
+
+        self.traffic_reports_last_id: dict[str, str] = {}
+        self.important_notice_last_id: str = ""
+
+        self.marked_as_read: int = 0
+
+
+# ------------------------------------------------------------------
+def fill(storage: StorageJson, last_ids: int) -> None:
+    """Fill the storage like after a while of traffic reports."""
+
+    storage.traffic_reports_last_id = {
+        f"{idx:024x}": f"{idx:024x}2026-01-01T12:00:00+00:00" for idx in range(last_ids)
+    }
+    storage.important_notice_last_id = "0" * 24 + "2026-01-01T12:00:00+00:00"
+    storage.marked_as_read = 42
+
+
+# ------------------------------------------------------------------
+def decode_pickled(storage: PickledTrafficStorage, raw: bytes) -> None:
+    """Decode like async_read_settings does for the jsonpickle path."""
+
+    data: dict = json_loads(raw)
+    tmp_obj = storage.decode_data(data.pop(storage.DICT_KEY___))
+    storage.__dict__.update(tmp_obj.__dict__)
+
+
+# ------------------------------------------------------------------
+def decode_fields(storage: TrafficStorage, raw: bytes) -> None:
+    """Decode like async_read_settings does for declared fields."""
+
+    storage.decode_fields(json_loads(raw))
+
+
+# ------------------------------------------------------------------
+def time_us(func) -> float:
+    """Best time in µs of a call."""
+
+    return min(repeat(func, number=NUMBER, repeat=REPEAT)) / NUMBER * 1_000_000
+
+
+# ------------------------------------------------------------------
+async def async_main() -> None:
+    """Run the benchmark."""
+
+    with TemporaryDirectory() as config_dir:
+        hass: HomeAssistant = HomeAssistant(config_dir)
+
+        try:
+            pickled: PickledTrafficStorage = PickledTrafficStorage(hass)
+            fields: TrafficStorage = TrafficStorage(hass)
+
+            print(
+                f"{'last ids':>8} {'codec':>8} {'encode µs':>10} {'decode µs':>10} "
+                f"{'bytes':>8}"
+            )
+
+            for last_ids in LAST_IDS:
+                fill(pickled, last_ids)
+                fill(fields, last_ids)
+
+                # Encoded the way the Store writes the data to write
+                raw_pickled: bytes = json_bytes(pickled.data_to_write())
+                raw_fields: bytes = json_bytes(fields.data_to_write())
+
+                decode_pickled(pickled, raw_pickled)
+                decode_fields(fields, raw_fields)
+                assert pickled.traffic_reports_last_id == fields.traffic_reports_last_id
+
+                for name, encode, decode, raw in (
+                    (
+                        "pickle",
+                        lambda: json_bytes(pickled.data_to_write()),
+                        lambda data=raw_pickled: decode_pickled(pickled, data),
+                        raw_pickled,
+                    ),
+                    (
+                        "fields",
+                        lambda: json_bytes(fields.data_to_write()),
+                        lambda data=raw_fields: decode_fields(fields, data),
+                        raw_fields,
+                    ),
+                ):
+                    print(
+                        f"{last_ids:>8} {name:>8} {time_us(encode):>10.1f} "
+                        f"{time_us(decode):>10.1f} {len(raw):>8}"
+                    )
+        finally:
+            await hass.async_stop(force=True)
+
+
+# ------------------------------------------------------------------
+def main() -> None:
+    """Run the benchmark."""
+
+    asyncio.run(async_main())
+
+
+if __name__ == "__main__":
+    main()
@@ -3,13 +3,17 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
+from datetime import timedelta
 
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import Platform
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers.aiohttp_client import async_get_clientsession
+from homeassistant.helpers.update_coordinator import DataUpdateCoordinator
 
 from .component_api import ComponentApi
+from .const import DOMAIN, LOGGER, UPDATE_INTERVAL_SECONDS
+from .report_model import TrafficSnapshot
 
 PLATFORMS: list[Platform] = [Platform.SENSOR]
 
@@ -21,6 +25,7 @@ class CommonData:
     """Common data."""
 
     component_api: ComponentApi
+    coordinator: DataUpdateCoordinator[TrafficSnapshot]
 
 
 # The type alias needs to be suffixed with 'ConfigEntry'
@@ -38,16 +43,36 @@ async def async_setup_entry(hass: HomeAssistant, entry: CommonConfigEntry) -> bo
     )
 
     await component_api.storage.async_read_settings()
+    component_api.compact_traffic_reports_last_id(force=True)
+    await component_api.async_restore_snapshot()
 
     entry.async_on_unload(entry.add_update_listener(config_update_listener))
+    entry.async_on_unload(component_api.remove_expiry_listener)
+    entry.async_on_unload(component_api.fire_event_batch)
+    entry.async_on_unload(component_api.storage.async_flush_settings)
+    entry.async_on_unload(component_api.snapshot_storage.async_flush_settings)
+
+    # One coordinator fetches both posts and notices for all sensors
+    coordinator: DataUpdateCoordinator[TrafficSnapshot] = DataUpdateCoordinator(
+        hass,
+        LOGGER,
+        name=DOMAIN,
+        update_interval=timedelta(seconds=UPDATE_INTERVAL_SECONDS),
+        update_method=component_api.async_update_data,
+        config_entry=entry,
+    )
+    coordinator.async_set_updated_data(component_api.publish_snapshot())
+    component_api.coordinator = coordinator
+
     entry.runtime_data = CommonData(
         component_api=component_api,
-        # coordinator=coordinator,
+        coordinator=coordinator,
     )
 
     await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
 
-    # await coordinator.async_config_entry_first_refresh()
+    # Not awaited, the sensors start with the restored snapshot
+    component_api.start_first_refresh()
 
     return True
 
@@ -70,6 +95,16 @@ async def config_update_listener(
     hass: HomeAssistant,
     config_entry: CommonConfigEntry,
 ) -> None:
-    """Reload on config entry update."""
+    """Apply options on config entry update.
+
+    The entry is only reloaded, if the changed options can not be applied
+    to the running component.
+    """
+
+    component_api: ComponentApi = config_entry.runtime_data.component_api
+
+    if component_api.options_require_reload():
+        await hass.config_entries.async_reload(config_entry.entry_id)
+        return
 
-    await hass.config_entries.async_reload(config_entry.entry_id)
+    await component_api.async_apply_options()
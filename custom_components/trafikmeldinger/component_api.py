@@ -1,21 +1,35 @@
 """Component api for Trafikmeldinger."""
 
-from asyncio import timeout
-from dataclasses import dataclass
-from datetime import UTC, datetime, timedelta
-from logging import Logger
-from re import IGNORECASE, Pattern, compile, escape
-
+from asyncio import Lock, Task, gather, shield, timeout
+from bisect import bisect_left, bisect_right
+from collections import OrderedDict
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass, replace
+from datetime import datetime, timedelta
+from heapq import heapify, heappop, heappush
+from http import HTTPStatus
+from time import monotonic, time
+from typing import Any
+
+from aiohttp import hdrs
 from aiohttp.client import ClientSession
+from babel import Locale
 from babel.dates import format_timedelta
 
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.event import async_call_later, async_track_point_in_utc_time
+from homeassistant.helpers.update_coordinator import DataUpdateCoordinator
 from homeassistant.util import dt as dt_util
+from homeassistant.util.json import json_loads
 
 from .const import (
+    CONF_BATCH_EVENTS,
+    CONF_BATCH_EVENTS_WINDOW,
+    CONF_EXCLUDE_LIST,
     CONF_MATCH_CASE,
     CONF_MATCH_LIST,
+    CONF_MATCH_UPDATES,
     CONF_MATCH_WORD,
     CONF_MAX_ROW_FETCH,
     CONF_MAX_TIME_BACK,
@@ -29,17 +43,43 @@ from .const import (
     CONF_TRANSPORT_TYPE,
     CONF_TRANSPORT_TYPE_ALL,
     CONF_TRANSPORT_TYPE_PRIVATE,
+    CONF_UPDATE_INTERVAL_MAX,
+    CONF_UPDATE_INTERVAL_MIN,
     DICT_REGION,
     DICT_TRANSPORT_TYPE,
     DOMAIN,
     EVENT_NEW_IMPORTANT_NOTICE,
     EVENT_NEW_TRAFFIC_REPORT,
+    EVENT_NEW_TRAFFIC_REPORTS,
+    LOGGER,
+    MATCH_VERDICT_CACHE_MAX_SIZE,
+    OPTIONS_REFILTER,
+    OPTIONS_RELOAD,
+    PAGE_FETCH_MAX,
+    PAGE_FETCH_MAX_SECONDS,
+    RELATIVE_TIME_BUCKET_SECONDS,
+    RELATIVE_TIME_CACHE_MAX_SIZE,
+    RENDER_CACHE_MAX_SIZE,
+    SHADOW_CACHE_MAX_AGE_HOURS,
+    SHADOW_CACHE_MAX_BYTES,
+    SHADOW_CACHE_MAX_SIZE,
+    SNAPSHOT_MAX_AGE_HOURS,
+    SNAPSHOT_STORAGE_KEY,
+    SNAPSHOT_STORAGE_VERSION,
+    SNAPSHOT_WRITE_DELAY,
     STORAGE_KEY,
     STORAGE_VERSION,
+    STORAGE_WRITE_DELAY,
+    TRAFFIC_REPORTS_LAST_ID_COMPACT_INTERVAL,
+    TRAFFIC_REPORTS_LAST_ID_RETENTION_HOURS,
 )
+from .filter_engine import REGION_SCOPES, TRANSPORT_TYPE_SCOPES, FilterEngine
 
 # from .storage_json import StorageJson
 from .hass_util import StorageJson, async_hass_add_executor_job, handle_retries
+from .poll_policy import AdaptivePollPolicy
+from .report_model import ImportantNotice, TrafficReport, TrafficSnapshot
+from .shadow_cache import ShadowCache
 
 
 # ------------------------------------------------------
@@ -48,11 +88,19 @@ from .hass_util import StorageJson, async_hass_add_executor_job, handle_retries
 class TrafficStorage(StorageJson):
     """TrafficStorage."""
 
+    storage_fields = (
+        "traffic_reports_last_id",
+        "important_notice_last_id",
+        "marked_as_read",
+    )
+
     # ------------------------------------------------------
     def __init__(self, hass: HomeAssistant) -> None:
         """Init."""
 
-        super().__init__(hass, STORAGE_KEY, STORAGE_VERSION)
+        super().__init__(
+            hass, STORAGE_KEY, STORAGE_VERSION, write_delay=STORAGE_WRITE_DELAY
+        )
 
         self.traffic_reports_last_id: dict[str, str] = {}
         self.important_notice_last_id: str = ""
@@ -60,6 +108,84 @@ class TrafficStorage(StorageJson):
         self.marked_as_read: int = 0
 
 
+# ------------------------------------------------------
+# ------------------------------------------------------
+@dataclass
+class TrafficSnapshotStorage(StorageJson):
+    """Snapshot of the cached reports, used for a warm start."""
+
+    storage_fields = (
+        "traffic_reports",
+        "important_notices",
+        "saved_ts",
+    )
+
+    # ------------------------------------------------------
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Init."""
+
+        super().__init__(
+            hass,
+            SNAPSHOT_STORAGE_KEY,
+            SNAPSHOT_STORAGE_VERSION,
+            write_delay=SNAPSHOT_WRITE_DELAY,
+        )
+
+        self.traffic_reports: list[TrafficReport] = []
+        self.important_notices: list[ImportantNotice] = []
+        self.saved_ts: float = 0.0
+
+    # ------------------------------------------------------
+    def encode_fields(self) -> dict:
+        """Encode the reports, when the snapshot is written."""
+
+        return {
+            "traffic_reports": [report.to_dict() for report in self.traffic_reports],
+            "important_notices": [
+                notice.to_dict() for notice in self.important_notices
+            ],
+            "saved_ts": time(),
+        }
+
+    # ------------------------------------------------------
+    def decode_fields(self, data: dict) -> dict | None:
+        """Decode the reports."""
+
+        tmp_dict: dict | None = super().decode_fields(data)
+
+        self.traffic_reports = [
+            TrafficReport.from_dict(report) for report in self.traffic_reports
+        ]
+        self.important_notices = [
+            ImportantNotice.from_dict(notice) for notice in self.important_notices
+        ]
+
+        return tmp_dict
+
+
+# ------------------------------------------------------------------
+# ------------------------------------------------------------------
+@dataclass
+class HttpValidator:
+    """Http cache validators for an url."""
+
+    etag: str = ""
+    last_modified: str = ""
+    body_hash: int = 0
+
+
+# ------------------------------------------------------------------
+# ------------------------------------------------------------------
+@dataclass
+class TrafficReportRender:
+    """Rendered traffic report, except the time relative part."""
+
+    formated_text: str
+    formated_updates_text: list
+    md_head: str
+    md_body: str
+
+
 # ------------------------------------------------------------------
 # ------------------------------------------------------------------
 @dataclass
@@ -78,92 +204,166 @@ class ComponentApi:
         self.entry: ConfigEntry = entry
         self.session: ClientSession | None = session
 
-        self.traffic_reports: list = []
-        self.important_notices: list = []
+        self.traffic_reports: list[TrafficReport] = []
+        self.traffic_reports_index: dict[str, TrafficReport] = {}
+        self.traffic_reports_pages_fetched: int = 0
+        self.traffic_reports_new_count: int = 0
+        self.expiry_heap: list[tuple[float, str]] = []
+        self.shadow_cache: ShadowCache = ShadowCache(
+            SHADOW_CACHE_MAX_SIZE,
+            SHADOW_CACHE_MAX_BYTES,
+            SHADOW_CACHE_MAX_AGE_HOURS * 3600,
+        )
+        self.unsub_expiry_listener: Callable[[], None] | None = None
+        self.important_notices: list[ImportantNotice] = []
         self.overview_traffic_md: str = ""
 
+        self.http_validators: dict[str, HttpValidator] = {}
+        self.http_validators_pending: dict[str, HttpValidator] = {}
+        self.traffic_reports_not_modified: bool = False
+        self.important_notices_not_modified: bool = False
+
+        self.render_cache: OrderedDict[tuple, TrafficReportRender] = OrderedDict()
+        self.render_cache_hits: int = 0
+        self.render_cache_misses: int = 0
+
+        self.babel_locale: Locale | None = None
+        self.relative_time_cache: dict[int, str] = {}
+
+        self.in_flight_tasks: dict[str, Task] = {}
+        self.traffic_reports_lock: Lock = Lock()
+        self.single_flight_started: dict[str, int] = {}
+        self.single_flight_coalesced: dict[str, int] = {}
+
         self.close_session: bool = False
 
+        self.coordinator: DataUpdateCoordinator[TrafficSnapshot] | None = None
+        self.generation: int = 0
+        self.state_writes: int = 0
+        self.state_writes_skipped: int = 0
+        self.poll_policy: AdaptivePollPolicy = AdaptivePollPolicy()
+
+        self.created_time: float = monotonic()
+        self.first_refresh_task: Task | None = None
+        self.first_refresh_seconds: float | None = None
+        self.snapshot_restored: bool = False
+
         self.request_timeout: int = 10
         self.storage: TrafficStorage = TrafficStorage(hass)
+        self.snapshot_storage: TrafficSnapshotStorage = TrafficSnapshotStorage(hass)
 
-        self.regex_comp: Pattern | None = None
+        self.filter_engine: FilterEngine | None = None
         self.traffic_report_rotate_pos: int = -1
+        self.traffic_report_rotate_start_pos: int = 0
+        self.unread_positions: list[int] = []
 
-        self.regex_comp = self.compile_any_word_regex(
-            entry.options.get(CONF_MATCH_LIST),
-            entry.options.get(CONF_MATCH_WORD, False),
-            entry.options.get(CONF_MATCH_CASE, False),
-        )
+        self.last_id_compacted_time: float | None = None
+        self.last_id_compacted: int = 0
+
+        self.event_batch: dict[str, dict[str, Any]] = {}
+        self.event_batch_collected: int = 0
+        self.event_batch_sequence: int = 0
+        self.unsub_event_batch: Callable[[], None] | None = None
+        self.events_fired: int = 0
+        self.events_saved: int = 0
+
+        self.state_listeners: list[Callable[[], None]] = []
+        self.options_listeners: list[Callable[[], None]] = []
+        self.applied_options: dict[str, Any] = dict(entry.options)
+
+        self.match_verdicts: dict[tuple[str, float, int], bool] = {}
+        self.match_filter_hash: int = 0
+        self.match_verdicts_filter_hash: int = 0
+
+        self.compile_match_filter()
 
         self._max_time_back: datetime = None
         self._max_time_back_concluded: datetime = None
 
     # ------------------------------------------------------------------
-    def compile_any_word_regex(
-        self,
-        words: list[str],
-        use_word_boundaries: bool = True,
-        case_sensitive: bool = False,
-    ) -> Pattern[str] | None:
-        """Returns a compiled regex pattern that matches if ANY word in the list is present in a text.
-
-        - use_word_boundaries: If True, only matches whole words.
-        - case_sensitive: If False, matches regardless of letter case.
+    def compile_match_filter(self) -> None:
+        """Compile the match filter from the options."""
+
+        self.filter_engine = FilterEngine(
+            self.entry.options.get(CONF_MATCH_LIST, []),
+            self.entry.options.get(CONF_EXCLUDE_LIST, []),
+            self.entry.options.get(CONF_MATCH_WORD, False),
+            self.entry.options.get(CONF_MATCH_CASE, False),
+            self.entry.options.get(CONF_MATCH_UPDATES, False),
+        )
+        self.match_filter_hash = hash(
+            (
+                tuple(self.entry.options.get(CONF_MATCH_LIST, [])),
+                tuple(self.entry.options.get(CONF_EXCLUDE_LIST, [])),
+                self.entry.options.get(CONF_MATCH_WORD, False),
+                self.entry.options.get(CONF_MATCH_CASE, False),
+                self.entry.options.get(CONF_MATCH_UPDATES, False),
+            )
+        )
+
+    # ------------------------------------------------------------------
+    def format_relative_time(self, timestamp: float, now: float) -> str:
+        """Format relative time, memoized by time bucket.
+
+        Must run in the executor, babel loads the locale from disk.
         """
 
-        if len(words) == 0:
-            return None
+        bucket: int = int((timestamp - now) // RELATIVE_TIME_BUCKET_SECONDS)
 
-        if use_word_boundaries:
-            pattern = r"|".join(
-                rf"\b{escape(word)}\b" for word in words if word.strip() != ""
+        tmp_text: str | None = self.relative_time_cache.get(bucket)
+
+        if tmp_text is None:
+            if self.babel_locale is None:
+                self.babel_locale = Locale.parse("da")
+
+            tmp_text = format_timedelta(
+                timedelta(seconds=bucket * RELATIVE_TIME_BUCKET_SECONDS),
+                add_direction=True,
+                locale=self.babel_locale,
             )
-        else:
-            pattern = r"|".join(escape(word) for word in words if word.strip() != "")
-        combined_pattern: str = f"({pattern})"
-        flags: int = 0 if case_sensitive else IGNORECASE
-        return compile(combined_pattern, flags)
+
+            if len(self.relative_time_cache) >= RELATIVE_TIME_CACHE_MAX_SIZE:
+                self.relative_time_cache.clear()
+
+            self.relative_time_cache[bucket] = tmp_text
+
+        return tmp_text
 
     # ------------------------------------------------------------------
     @async_hass_add_executor_job()
-    def relative_time(self, iso_datetime: str) -> str:
-        """Relative time."""
+    def relative_times(self, timestamps: list[float]) -> list[str]:
+        """Relative times, computed in one executor job."""
 
-        diff: timedelta = datetime.fromisoformat(iso_datetime) - dt_util.now()
+        now: float = time()
 
-        return format_timedelta(diff, add_direction=True, locale="da")
+        return [self.format_relative_time(timestamp, now) for timestamp in timestamps]
 
     # ------------------------------------------------------
-    def traffic_report_format(self, report: dict) -> str:
+    def traffic_report_format(self, report: TrafficReport) -> str:
         """Format traffic report."""
 
-        if report.get("concluded", False):
-            return "Afsluttet -" + report["text"][:243]
-        return report["text"][:255]
+        if report.concluded:
+            return "Afsluttet -" + report.text[:243]
+        return report.text[:255]
 
     # ------------------------------------------------------
-    def traffic_report_updates_format(self, report: dict) -> list:
+    def traffic_report_updates_format(self, report: TrafficReport) -> list:
         """Format traffic report updates."""
 
-        if report.get("updates") is not None:
-            tmp_list: list = [x["text"] for x in report["updates"]]
-            return tmp_list
-
-        return {}
+        return [update.text for update in report.updates]
 
     # ------------------------------------------------------
-    async def async_traffic_report_format_md(self, report: dict) -> str:
-        """Format traffic report as markdown."""
+    def traffic_report_format_md_parts(self, report: TrafficReport) -> tuple[str, str]:
+        """Format traffic report as markdown, split around the relative time."""
 
         tmp_md: str = ""
 
-        if report.get("concluded", False):
+        if report.concluded:
             tmp_color: str = "green"
         else:
             tmp_color = "red"
 
-        if report["type"] == CONF_TRANSPORT_TYPE_PRIVATE:
+        if report.type == CONF_TRANSPORT_TYPE_PRIVATE:
             tmp_md = (
                 "###  <font color="
                 + tmp_color
@@ -176,97 +376,124 @@ class ComponentApi:
                 + '> <ha-icon icon="mdi:train-bus"></ha-icon></font> '
             )
 
-        tmp_md += DICT_REGION[report["region"]]
+        tmp_md += DICT_REGION[report.region]
 
-        tmp_md += " " + await self.relative_time(report["createdTime"])
+        tmp_md_body: str = ""
 
-        if report.get("concluded", False):
-            tmp_md += "\n\n**Afsluttet** - " + report["text"]
+        if report.concluded:
+            tmp_md_body += "\n\n**Afsluttet** - " + report.text
         else:
-            tmp_md += "\n\n" + report["text"]
+            tmp_md_body += "\n\n" + report.text
 
-        if report.get("updates") is not None and len(report["updates"]) > 0:
+        if len(report.updates) > 0:
             if self.entry.options.get(CONF_ONLY_SHOW_LAST_UPDATE, True):
-                tmp_md += (
+                tmp_md_body += (
                     "\n\n>"
-                    + datetime.fromisoformat(
-                        report["updates"][0]["createdTime"]
-                    ).strftime("Kl. %H.%M: ")
-                    + str(report["updates"][0]["text"]).replace("\n\n", "\n")
+                    + datetime.fromisoformat(report.updates[0].created_time).strftime(
+                        "Kl. %H.%M: "
+                    )
+                    + str(report.updates[0].text).replace("\n\n", "\n")
                 )
 
             else:
-                for update in report["updates"]:
-                    tmp_md += (
+                for update in report.updates:
+                    tmp_md_body += (
                         "\n\n>"
-                        + datetime.fromisoformat(update["createdTime"]).strftime(
+                        + datetime.fromisoformat(update.created_time).strftime(
                             "Kl. %H.%M: "
                         )
-                        + str(update["text"]).replace("\n\n", "\n")
+                        + str(update.text).replace("\n\n", "\n")
                     )
 
-        return tmp_md
+        return tmp_md, tmp_md_body
 
     # ------------------------------------------------------
-    def important_notice_format(self, report: dict) -> str:
-        """Format important notice."""
+    def traffic_report_render(self, report: TrafficReport) -> TrafficReportRender:
+        """Get rendered traffic report from the render cache."""
+
+        key: tuple = (
+            report.id,
+            report.updated_ts,
+            report.concluded,
+            len(report.updates),
+            self.entry.options.get(CONF_ONLY_SHOW_LAST_UPDATE, True),
+        )
 
-        return report["text"][:255]
+        render: TrafficReportRender | None = self.render_cache.get(key)
 
-    # ------------------------------------------------------
-    def get_rotating_traffic_report(self) -> dict:
-        """Get rotating traffic report."""
+        if render is not None:
+            self.render_cache_hits += 1
+            self.render_cache.move_to_end(key)
+            return render
 
-        if len(self.traffic_reports) == 0 or self.traffic_report_rotate_pos == -1:
-            return None
+        self.render_cache_misses += 1
 
-        return self.traffic_reports[self.traffic_report_rotate_pos]
+        render = TrafficReportRender(
+            self.traffic_report_format(report),
+            self.traffic_report_updates_format(report),
+            *self.traffic_report_format_md_parts(report),
+        )
+        self.render_cache[key] = render
 
-    # ------------------------------------------------------
-    def get_latest_open_traffic_report(self) -> dict:
-        """Get latest (open) traffic report."""
+        while len(self.render_cache) > RENDER_CACHE_MAX_SIZE:
+            self.render_cache.popitem(last=False)
 
-        if len(self.traffic_reports) == 0:
-            return None
+        return render
 
-        # Prioritize not concluded
-        if self.traffic_reports[0].get("concluded", False):
-            for idx, item in enumerate(self.traffic_reports):
-                if not item.get("concluded", False):
-                    return self.traffic_reports[idx]
+    # ------------------------------------------------------
+    def important_notice_format(self, report: ImportantNotice) -> str:
+        """Format important notice."""
 
-        return self.traffic_reports[0]
+        return report.text[:255]
 
     # ------------------------------------------------------
-    async def async_important_notice_format_md(self, report: dict) -> str:
+    def important_notice_format_md(
+        self, report: ImportantNotice, relative_time: str
+    ) -> str:
         """Format important notice as markdown."""
 
         tmp_md: str = '###  <font color=red> <ha-icon icon="mdi:exclamation-thick"></ha-icon></font> '
 
-        tmp_md += " Vigtig meddelelse " + str(
-            await self.relative_time(report["updatedTime"])
-        )
+        tmp_md += " Vigtig meddelelse " + str(relative_time)
 
-        tmp_md += "\n\n" + report["text"]
+        tmp_md += "\n\n" + report.text
 
         return tmp_md
 
     # ------------------------------------------------------
-    async def async_formatted_traffic_reports(self) -> None:
-        """Format traffic reports."""
+    async def async_formatted_traffic_reports(
+        self, reports: list[TrafficReport] | None = None
+    ) -> None:
+        """Format traffic reports, by default the current list."""
 
-        for report in self.traffic_reports:
-            report["formated_text"] = self.traffic_report_format(report)
-            report["formated_updates_text"] = self.traffic_report_updates_format(report)
-            report["markdown"] = await self.async_traffic_report_format_md(report)
+        # The list can be swapped, while waiting for the relative times
+        tmp_reports: list[TrafficReport] = (
+            self.traffic_reports if reports is None else reports
+        )
+
+        relative_times: list[str] = await self.relative_times(
+            [report.created_ts for report in tmp_reports]
+        )
+
+        for report, relative_time in zip(tmp_reports, relative_times, strict=True):
+            render: TrafficReportRender = self.traffic_report_render(report)
+            report.formated_text = render.formated_text
+            report.formated_updates_text = render.formated_updates_text
+            report.markdown = render.md_head + " " + relative_time + render.md_body
 
     # ------------------------------------------------------
     async def async_formatted_important_notices(self) -> None:
         """Format notices."""
 
-        for notice in self.important_notices:
-            notice["formated_text"] = self.important_notice_format(notice)
-            notice["markdown"] = await self.async_important_notice_format_md(notice)
+        relative_times: list[str] = await self.relative_times(
+            [notice.updated_ts for notice in self.important_notices]
+        )
+
+        for notice, relative_time in zip(
+            self.important_notices, relative_times, strict=True
+        ):
+            notice.formated_text = self.important_notice_format(notice)
+            notice.markdown = self.important_notice_format_md(notice, relative_time)
 
     # ------------------------------------------------------
     async def async_update_important_notice_last_event_id(self) -> None:
@@ -274,46 +501,104 @@ class ComponentApi:
 
         if len(self.important_notices) == 0:
             self.storage.important_notice_last_id = ""
-            await self.storage.async_write_settings()
+            self.storage.delay_write_settings()
         elif self.storage.important_notice_last_id != (
-            self.important_notices[0]["_id"]
-            + " "
-            + self.important_notices[0]["updatedTime"]
+            self.important_notices[0].id + " " + self.important_notices[0].updated_time
         ):
             self.storage.important_notice_last_id = (
-                self.important_notices[0]["_id"]
+                self.important_notices[0].id
                 + " "
-                + self.important_notices[0]["updatedTime"]
+                + self.important_notices[0].updated_time
             )
 
-            await self.storage.async_write_settings()
+            self.storage.delay_write_settings()
+
+    # ------------------------------------------------------
+    def compact_traffic_reports_last_id(self, force: bool = False) -> bool:
+        """Compact the last event id of the traffic reports.
+
+        Only entries for cached traffic reports, or updated within the
+        retention window, are kept. Runs at most once per compact interval,
+        unless forced.
+        """
+
+        if (
+            not force
+            and self.last_id_compacted_time is not None
+            and monotonic() - self.last_id_compacted_time
+            < TRAFFIC_REPORTS_LAST_ID_COMPACT_INTERVAL
+        ):
+            return False
+
+        self.last_id_compacted_time = monotonic()
+        tmp_min_ts: float = time() - TRAFFIC_REPORTS_LAST_ID_RETENTION_HOURS * 3600
+
+        # ---------------------
+        def _keep(report_id: str, updated_time: str) -> bool:
+            if report_id in self.traffic_reports_index:
+                return True
+
+            try:
+                return datetime.fromisoformat(updated_time).timestamp() >= tmp_min_ts
+            except ValueError:
+                return False
+
+        # ---------------------
+
+        tmp_last_id: dict[str, str] = {
+            report_id: updated_time
+            for report_id, updated_time in self.storage.traffic_reports_last_id.items()
+            if _keep(report_id, updated_time)
+        }
+
+        tmp_removed: int = len(self.storage.traffic_reports_last_id) - len(tmp_last_id)
+
+        if tmp_removed == 0:
+            return False
+
+        self.storage.traffic_reports_last_id = tmp_last_id
+        self.last_id_compacted += tmp_removed
+        self.storage.delay_write_settings()
+
+        return True
 
     # ------------------------------------------------------
     async def async_traffic_reports_event_fire(self) -> str:
-        """Traffic report event fire."""
+        """Traffic report event fire.
+
+        With batched events, the reports are collected and fired as one
+        event, when the coalescing window is over.
+        """
+
+        batch_events: bool = self.entry.options.get(CONF_BATCH_EVENTS, False)
 
         # ---------------------
-        async def _fire_event(report: dict) -> str:
-            if report.get("updates") is not None and len(report["updates"]) > 0:
-                tmp_updated_time: str = report["updates"][0]["createdTime"]
-            else:
-                tmp_updated_time = report["updatedTime"]
+        async def _fire_event(report: TrafficReport) -> str:
+            tmp_updated_time: str = report.last_updated_time
 
             if (
-                self.storage.traffic_reports_last_id.get(report["_id"], "")
+                self.storage.traffic_reports_last_id.get(report.id, "")
                 != tmp_updated_time
             ):
-                self.hass.bus.async_fire(
-                    DOMAIN + "." + EVENT_NEW_TRAFFIC_REPORT,
-                    {
-                        "ny_melding": report["text"],
-                        "opdateringer": report["formated_updates_text"],
-                        "region": DICT_REGION[report["region"]],
-                        "transporttype": DICT_TRANSPORT_TYPE[report["type"]],
-                        "oprettet_tidspunkt": report["createdTime"],
-                        "opdateret_tidspunkt": report["updatedTime"],
-                    },
-                )
+                event_data: dict[str, Any] = {
+                    "ny_melding": report.text,
+                    "opdateringer": report.formated_updates_text,
+                    "region": DICT_REGION[report.region],
+                    "transporttype": DICT_TRANSPORT_TYPE[report.type],
+                    "oprettet_tidspunkt": report.created_time,
+                    "opdateret_tidspunkt": report.updated_time,
+                }
+
+                if batch_events:
+                    # A report updated again within the window is only sent once
+                    self.event_batch[report.id] = event_data
+                    self.event_batch_collected += 1
+                else:
+                    self.hass.bus.async_fire(
+                        DOMAIN + "." + EVENT_NEW_TRAFFIC_REPORT, event_data
+                    )
+                    self.events_fired += 1
+
                 return tmp_updated_time
 
             return ""
@@ -326,44 +611,94 @@ class ComponentApi:
             return False
 
         for report in reversed(self.traffic_reports):
-            if report.get("concluded", True):
-                if self.storage.traffic_reports_last_id.get(report["_id"], "") == "":
+            if report.concluded:
+                if self.storage.traffic_reports_last_id.get(report.id, "") == "":
                     continue
 
                 await _fire_event(report)
 
-                self.storage.traffic_reports_last_id.pop(report["_id"], None)
+                self.storage.traffic_reports_last_id.pop(report.id, None)
                 update_stg = True
 
             else:
                 tmp_updated_time = await _fire_event(report)
 
                 if tmp_updated_time != "":
-                    self.storage.traffic_reports_last_id[report["_id"]] = (
-                        tmp_updated_time
-                    )
+                    self.storage.traffic_reports_last_id[report.id] = tmp_updated_time
                     update_stg = True
 
+        if len(self.event_batch) > 0:
+            self.schedule_event_batch()
+
         return update_stg
 
+    # ------------------------------------------------------
+    def schedule_event_batch(self) -> None:
+        """Fire the collected traffic reports, when the window is over."""
+
+        window: float = self.entry.options.get(CONF_BATCH_EVENTS_WINDOW, 0)
+
+        if window <= 0:
+            self.fire_event_batch()
+            return
+
+        # The window starts with the first collected report
+        if self.unsub_event_batch is None:
+            self.unsub_event_batch = async_call_later(
+                self.hass, window, self.handle_event_batch
+            )
+
+    # ------------------------------------------------------
+    @callback
+    def handle_event_batch(self, _now: datetime) -> None:
+        """Handle the coalescing window being over."""
+
+        self.unsub_event_batch = None
+        self.fire_event_batch()
+
+    # ------------------------------------------------------
+    def fire_event_batch(self) -> None:
+        """Fire one event with the collected traffic reports."""
+
+        if self.unsub_event_batch is not None:
+            self.unsub_event_batch()
+            self.unsub_event_batch = None
+
+        if len(self.event_batch) == 0:
+            return
+
+        self.event_batch_sequence += 1
+
+        self.hass.bus.async_fire(
+            DOMAIN + "." + EVENT_NEW_TRAFFIC_REPORTS,
+            {
+                "sekvens": self.event_batch_sequence,
+                "antal": len(self.event_batch),
+                "trafikmeldinger": list(self.event_batch.values()),
+            },
+        )
+        self.events_fired += 1
+        self.events_saved += self.event_batch_collected - 1
+
+        self.event_batch = {}
+        self.event_batch_collected = 0
+
     # ------------------------------------------------------
     async def async_important_notice_event_fire(self) -> None:
         """Fire important notice event."""
 
-        if len(self.important_notices) == 0:
+        if self.important_notices_not_modified or len(self.important_notices) == 0:
             return
 
         if self.storage.important_notice_last_id != (
-            self.important_notices[0]["_id"]
-            + " "
-            + self.important_notices[0]["updatedTime"]
+            self.important_notices[0].id + " " + self.important_notices[0].updated_time
         ):
             self.hass.bus.async_fire(
                 DOMAIN + "." + EVENT_NEW_IMPORTANT_NOTICE,
                 {
-                    "ny_melding": self.important_notices[0]["text"],
-                    "oprettet_tidspunkt": self.important_notices[0]["createdTime"],
-                    "opdateret_tidspunkt": self.important_notices[0]["updatedTime"],
+                    "ny_melding": self.important_notices[0].text,
+                    "oprettet_tidspunkt": self.important_notices[0].created_time,
+                    "opdateret_tidspunkt": self.important_notices[0].updated_time,
                 },
             )
         await self.async_update_important_notice_last_event_id()
@@ -376,33 +711,32 @@ class ComponentApi:
 
         if (
             self.important_notices
-            and "markdown" in self.important_notices[0]
+            and self.important_notices[0].markdown
             and self.entry.options.get(CONF_OVERVIEW_IMPORTANT_NOTICES, True)
         ):
-            self.overview_traffic_md += self.important_notices[0]["markdown"]
+            self.overview_traffic_md += self.important_notices[0].markdown
 
         if (
             self.traffic_reports
-            and "markdown" in self.traffic_reports[0]
+            and self.traffic_reports[0].markdown
             and self.entry.options.get(CONF_OVERVIEW_LATEST_TRAFFIC_REPORT, True)
         ):
             if self.overview_traffic_md:
                 self.overview_traffic_md += "\n___\n"
             self.overview_traffic_md += (
-                "### Seneste trafikmelding:\n" + self.traffic_reports[0]["markdown"]
+                "### Seneste trafikmelding:\n" + self.traffic_reports[0].markdown
             )
 
         if (
-            self.traffic_reports
-            and self.traffic_report_rotate_pos > 0
-            and "markdown" in self.traffic_reports[self.traffic_report_rotate_pos]
+            0 < self.traffic_report_rotate_pos < len(self.traffic_reports)
+            and self.traffic_reports[self.traffic_report_rotate_pos].markdown
             and self.entry.options.get(CONF_OVERVIEW_PREVIOUS_TRAFFIC_REPORTS, True)
         ):
             if self.overview_traffic_md:
                 self.overview_traffic_md += "\n___\n"
             self.overview_traffic_md += (
                 "### Tidligere trafikmelderinger:\n"
-                + self.traffic_reports[self.traffic_report_rotate_pos]["markdown"]
+                + self.traffic_reports[self.traffic_report_rotate_pos].markdown
             )
 
         if self.overview_traffic_md:
@@ -414,10 +748,349 @@ class ComponentApi:
                 "## Trafikmeldinger:\nIngen aktuelle trafikmeldinger"
             )
 
+    # ------------------------------------------------------
+    def async_add_state_listener(
+        self, update_callback: Callable[[], None]
+    ) -> Callable[[], None]:
+        """Listen for local state updates."""
+
+        self.state_listeners.append(update_callback)
+
+        def remove_listener() -> None:
+            self.state_listeners.remove(update_callback)
+
+        return remove_listener
+
+    # ------------------------------------------------------
+    async def async_update_state(self, rotate: bool = False) -> None:
+        """Update state from the cached reports, without fetching.
+
+        Moves the rotation position away from read reports, rebuilds the
+        overview markdown and notifies the state listeners.
+        """
+
+        if (
+            rotate
+            or self.traffic_report_rotate_pos == -1
+            or self.traffic_report_rotate_pos >= len(self.traffic_reports)
+            or self.traffic_reports[self.traffic_report_rotate_pos].read
+        ):
+            self.get_next_traffic_report_pos(self.traffic_report_rotate_start_pos)
+
+        await self.async_create_overview_traffic_md()
+        self.publish_snapshot()
+
+        # Rotating does not change the reports, and would keep postponing
+        # the delayed write
+        if not rotate:
+            self.save_snapshot()
+
+        for update_callback in list(self.state_listeners):
+            update_callback()
+
+    # ------------------------------------------------------
+    def save_snapshot(self) -> None:
+        """Save a snapshot of the cached reports, after the write delay."""
+
+        self.snapshot_storage.traffic_reports = self.traffic_reports
+        self.snapshot_storage.important_notices = self.important_notices
+        self.snapshot_storage.delay_write_settings()
+
+    # ------------------------------------------------------
+    async def async_restore_snapshot(self) -> None:
+        """Restore the cached reports from the snapshot.
+
+        Restored reports are filtered with the current options, and merged
+        with the fetched reports on the first refresh. A stale snapshot is
+        not restored.
+        """
+
+        try:
+            await self.snapshot_storage.async_read_settings()
+        except (KeyError, TypeError, ValueError) as e:
+            LOGGER.warning("Ignoring invalid traffic report snapshot: %s", e)
+            return
+
+        if self.snapshot_storage.saved_ts + SNAPSHOT_MAX_AGE_HOURS * 3600 < time():
+            LOGGER.debug(
+                "Ignoring traffic report snapshot older than %s hours",
+                SNAPSHOT_MAX_AGE_HOURS,
+            )
+            return
+
+        self.traffic_reports = list(self.snapshot_storage.traffic_reports)
+        self.important_notices = list(self.snapshot_storage.important_notices)
+        self.snapshot_restored = (
+            len(self.traffic_reports) > 0 or len(self.important_notices) > 0
+        )
+
+        await self.async_refilter_traffic_reports()
+        await self.async_formatted_traffic_reports()
+        await self.async_formatted_important_notices()
+        await self.async_create_overview_traffic_md()
+
+        LOGGER.debug(
+            "Restored %s traffic report(s) and %s important notice(s) from snapshot",
+            len(self.traffic_reports),
+            len(self.important_notices),
+        )
+
+    # ------------------------------------------------------
+    def async_add_options_listener(
+        self, update_callback: Callable[[], None]
+    ) -> Callable[[], None]:
+        """Listen for options applied without a reload."""
+
+        self.options_listeners.append(update_callback)
+
+        def remove_listener() -> None:
+            self.options_listeners.remove(update_callback)
+
+        return remove_listener
+
+    # ------------------------------------------------------
+    def changed_options(self) -> set[str]:
+        """Get the options changed since they were last applied."""
+
+        return {
+            key
+            for key in self.entry.options.keys() | self.applied_options.keys()
+            if self.entry.options.get(key) != self.applied_options.get(key)
+        }
+
+    # ------------------------------------------------------
+    def options_require_reload(self) -> bool:
+        """Check if the changed options require the entry to be reloaded."""
+
+        return not self.changed_options().isdisjoint(OPTIONS_RELOAD)
+
+    # ------------------------------------------------------
+    async def async_apply_options(self) -> None:
+        """Apply changed options to the cached reports, without fetching."""
+
+        await self.async_locked(self._async_apply_options)
+
+    # ------------------------------------------------------
+    async def _async_apply_options(self) -> None:
+        """Apply changed options to the cached reports, without fetching."""
+
+        changed: set[str] = self.changed_options()
+        self.applied_options = dict(self.entry.options)
+
+        if len(changed) == 0:
+            return
+
+        self.compile_match_filter()
+
+        if not changed.isdisjoint(OPTIONS_REFILTER):
+            await self.async_refilter_traffic_reports()
+
+        for update_callback in list(self.options_listeners):
+            update_callback()
+
+        await self.async_formatted_traffic_reports()
+        await self.async_update_state()
+
+    # ------------------------------------------------------
+    async def async_refilter_traffic_reports(self) -> None:
+        """Filter the cached traffic reports again with the current options.
+
+        Reports filtered out are moved to the shadow cache, and reports in the
+        shadow cache matching now are moved back.
+        """
+
+        max_row_fetch: int = int(self.entry.options.get(CONF_MAX_ROW_FETCH, 0))
+
+        if max_row_fetch == 0:
+            max_row_fetch = 40
+
+        self.shadow_cache.expire(time())
+
+        tmp_reports: list[TrafficReport] = []
+
+        for report in [*self.traffic_reports, *self.shadow_cache.reports.values()]:
+            if await self.async_is_old_report(
+                report
+            ) is False and await self.async_is_match_traffic_report(report):
+                tmp_reports.append(report)
+            else:
+                self.shadow_cache.put(report)
+
+        for report in tmp_reports:
+            self.shadow_cache.pop(report.id)
+
+        tmp_reports.sort(key=lambda x: x.updated_ts, reverse=True)
+
+        for report in tmp_reports[max_row_fetch:]:
+            self.shadow_cache.put(report)
+
+        tmp_reports = tmp_reports[:max_row_fetch]
+
+        # Reports from the shadow cache have not been rendered
+        await self.async_formatted_traffic_reports(tmp_reports)
+        self.swap_traffic_reports(
+            tmp_reports, {report.id: report for report in tmp_reports}
+        )
+
+        # Expiry times depend on the max time back options
+        self.expiry_heap = []
+
+        for report in tmp_reports:
+            self.push_traffic_report_expiry(report)
+
+        self.schedule_expiry_listener()
+
+    # ------------------------------------------------------
+    async def async_single_flight(
+        self, key: str, func: Callable[[], Awaitable[Any]]
+    ) -> Any:
+        """Run func once for concurrent callers with the same key.
+
+        Callers arriving while a call is in flight await the same task,
+        instead of starting a new one. The task is owned by the config entry,
+        so unloading the entry cancels it.
+        """
+
+        task: Task | None = self.in_flight_tasks.get(key)
+
+        if task is not None and not task.done():
+            self.single_flight_coalesced[key] = (
+                self.single_flight_coalesced.get(key, 0) + 1
+            )
+            return await shield(task)
+
+        task = self.entry.async_create_background_task(
+            self.hass, func(), f"{DOMAIN} {key}"
+        )
+        self.in_flight_tasks[key] = task
+        self.single_flight_started[key] = self.single_flight_started.get(key, 0) + 1
+
+        try:
+            return await shield(task)
+        finally:
+            if task.done() and self.in_flight_tasks.get(key) is task:
+                del self.in_flight_tasks[key]
+
+    # ------------------------------------------------------
+    async def async_locked(self, func: Callable[[], Awaitable[Any]]) -> Any:
+        """Run func, while holding the traffic reports lock.
+
+        Refreshing, expiring and applying options all replace the traffic
+        reports, so they run one after the other, instead of being folded
+        into each other.
+        """
+
+        async with self.traffic_reports_lock:
+            return await func()
+
+    # ------------------------------------------------------
+    @property
+    def has_data(self) -> bool:
+        """Check if there is data to show, fetched or restored."""
+
+        return self.snapshot_restored or self.first_refresh_seconds is not None
+
+    # ------------------------------------------------------
+    def start_first_refresh(self) -> Task:
+        """Start the first refresh in the background, once.
+
+        Setup does not wait for the fetch, the entities show the restored
+        snapshot or are unavailable until it is done.
+        """
+
+        if self.first_refresh_task is None:
+            self.first_refresh_task = self.entry.async_create_background_task(
+                self.hass, self.async_first_refresh(), f"{DOMAIN} first refresh"
+            )
+
+        return self.first_refresh_task
+
+    # ------------------------------------------------------
+    async def async_first_refresh(self) -> None:
+        """First refresh of the coordinator."""
+
+        try:
+            await self.coordinator.async_refresh()
+
+        finally:
+            self.first_refresh_seconds = monotonic() - self.created_time
+            LOGGER.debug(
+                "First refresh done %.2f seconds after setup",
+                self.first_refresh_seconds,
+            )
+
+        # The refresh notified the listeners, before has_data was set
+        self.coordinator.async_update_listeners()
+
+    # ------------------------------------------------------
+    def publish_snapshot(self) -> TrafficSnapshot:
+        """Publish a new generation of the cached reports and overview.
+
+        Set directly as coordinator data, so publishing outside a refresh
+        does not reschedule the next poll.
+        """
+
+        self.generation += 1
+
+        snapshot: TrafficSnapshot = TrafficSnapshot(
+            traffic_reports=tuple(self.traffic_reports),
+            important_notices=tuple(self.important_notices),
+            overview_traffic_md=self.overview_traffic_md,
+            fetched_ts=time(),
+            generation=self.generation,
+            traffic_report_rotate_pos=self.traffic_report_rotate_pos,
+            marked_as_read=self.storage.marked_as_read,
+        )
+
+        if self.coordinator is not None:
+            self.coordinator.data = snapshot
+
+        return snapshot
+
+    # ------------------------------------------------------
+    async def async_update_data(self) -> TrafficSnapshot:
+        """Fetch traffic reports and important notices in parallel.
+
+        Used as the update method of the coordinator, so the overview is
+        built from posts and notices of the same fetch.
+        """
+
+        _, notices_changed = await gather(
+            self.async_refresh_traffic_reports(),
+            self.async_refresh_important_notices(),
+        )
+        await self.async_important_notice_event_fire()
+        await self.async_create_overview_traffic_md()
+
+        self.coordinator.update_interval = timedelta(
+            seconds=self.poll_policy.next_interval(
+                dt_util.now(),
+                self.traffic_reports_new_count + int(notices_changed),
+                self.entry.options.get(CONF_UPDATE_INTERVAL_MIN, 1) * 60,
+                self.entry.options.get(CONF_UPDATE_INTERVAL_MAX, 10) * 60,
+            )
+        )
+        LOGGER.debug(
+            "Next poll in %s seconds (%s)",
+            self.poll_policy.interval_seconds,
+            self.poll_policy.reason,
+        )
+
+        return self.publish_snapshot()
+
     # ------------------------------------------------------
     async def async_refresh_traffic_reports(self) -> None:
         """Refresh traffic report."""
 
+        await self.async_single_flight(
+            "traffic_reports",
+            lambda: self.async_locked(self._async_refresh_traffic_reports),
+        )
+
+    # ------------------------------------------------------
+    async def _async_refresh_traffic_reports(self) -> None:
+        """Refresh traffic report."""
+
         if self.session is None:
             self.session = ClientSession()
             self.close_session = True
@@ -425,8 +1098,17 @@ class ComponentApi:
         # self.set_max_time_back()
 
         tmp_result: bool = await self.async_get_new_traffic_reports()
+        self.compact_traffic_reports_last_id()
 
-        await self.async_formatted_traffic_reports()
+        if self.traffic_reports_not_modified:
+            if self.session and self.close_session:
+                await self.session.close()
+
+            if await self.async_remove_to_old_traffic_reports():
+                await self.async_create_overview_traffic_md()
+                self.storage.delay_write_settings()
+                self.save_snapshot()
+            return
 
         if self.session and self.close_session:
             await self.session.close()
@@ -438,14 +1120,23 @@ class ComponentApi:
             tmp_result = True
 
         await self.async_create_overview_traffic_md()
+        self.save_snapshot()
 
         if tmp_result:
-            await self.storage.async_write_settings()
+            self.storage.delay_write_settings()
 
     # ------------------------------------------------------
     async def async_refresh_important_notices(self) -> bool:
         """Refresh important notices."""
 
+        return await self.async_single_flight(
+            "important_notices", self._async_refresh_important_notices
+        )
+
+    # ------------------------------------------------------
+    async def _async_refresh_important_notices(self) -> bool:
+        """Refresh important notices."""
+
         if self.session is None:
             self.session = ClientSession()
             self.close_session = True
@@ -453,134 +1144,282 @@ class ComponentApi:
         # self.set_max_time_back()
 
         tmp_result: bool = await self.async_get_important_notices()
-        await self.async_formatted_important_notices()
 
         if self.session and self.close_session:
             await self.session.close()
 
+        await self.async_formatted_important_notices()
+
+        if self.important_notices_not_modified:
+            return False
+
+        self.save_snapshot()
+
         if tmp_result:
-            await self.storage.async_write_settings()
+            self.storage.delay_write_settings()
 
         return tmp_result
 
     # ------------------------------------------------------
-    async def async_is_match_traffic_report(self, check_report: dict) -> bool:
-        """Check of traffic report is a match."""
+    async def async_is_match_traffic_report(self, check_report: TrafficReport) -> bool:
+        """Check of traffic report is a match.
+
+        The verdict is memoized per report version, until the filter changes.
+        """
 
-        if self.regex_comp is None:
+        if self.filter_engine is None or self.filter_engine.is_empty:
             return True
 
-        tmp_txt: str = check_report["text"]
+        if (
+            self.match_filter_hash != self.match_verdicts_filter_hash
+            or len(self.match_verdicts) >= MATCH_VERDICT_CACHE_MAX_SIZE
+        ):
+            self.match_verdicts.clear()
+            self.match_verdicts_filter_hash = self.match_filter_hash
 
-        if check_report.get("reference") is not None:
-            tmp_txt += check_report["reference"]["text"]
+        key: tuple[str, float, int] = (
+            check_report.id,
+            check_report.updated_ts,
+            len(check_report.updates),
+        )
+        verdict: bool | None = self.match_verdicts.get(key)
 
-        if self.regex_comp.search(tmp_txt):
-            return True
-        return False
+        if verdict is None:
+            verdict = self.filter_engine.is_match(check_report)
+            self.match_verdicts[key] = verdict
+
+        return verdict
 
     # ------------------------------------------------------
-    async def async_is_old_report(self, check_report: dict) -> bool:
+    async def async_is_old_report(
+        self, check_report: TrafficReport | ImportantNotice
+    ) -> bool:
         """Check of traffic report is to old."""
 
-        # tmp_rep_time = dt_util.as_local(
-        #     datetime.fromisoformat(check_report.get("updatedTime"))
-        # ) + timedelta(hours=self.entry.options.get(CONF_MAX_TIME_BACK, 0))
-
-        # tmp_now = dt_util.as_local(datetime.now(UTC))
+        tmp_now: float = time()
 
         if (
-            dt_util.as_local(datetime.fromisoformat(check_report.get("updatedTime")))
-            + timedelta(hours=self.entry.options.get(CONF_MAX_TIME_BACK, 0))
-        ) < dt_util.as_local(datetime.now(UTC)):
+            check_report.updated_ts
+            + self.entry.options.get(CONF_MAX_TIME_BACK, 0) * 3600
+        ) < tmp_now:
             return True
 
-        if check_report.get("concluded", False) is True:
+        if isinstance(check_report, TrafficReport) and check_report.concluded:
             if (
-                dt_util.as_local(
-                    datetime.fromisoformat(check_report.get("updatedTime"))
-                )
-                + timedelta(
-                    hours=self.entry.options.get(CONF_MAX_TIME_BACK_CONCLUDED, 2)
-                )
-            ) < dt_util.as_local(datetime.now(UTC)):
+                check_report.updated_ts
+                + self.entry.options.get(CONF_MAX_TIME_BACK_CONCLUDED, 2) * 3600
+            ) < tmp_now:
                 return True
 
         return False
 
-        # if (
-        #     self._max_time_back is not None
-        #     and datetime.fromisoformat(check_report["updatedTime"])
-        #     < self._max_time_back
-        # ):
-        #     return True
+    # ------------------------------------------------------
+    def traffic_report_expiry_ts(self, report: TrafficReport) -> float:
+        """Get the time a traffic report gets to old."""
+
+        expiry_ts: float = (
+            report.updated_ts + self.entry.options.get(CONF_MAX_TIME_BACK, 0) * 3600
+        )
+
+        if report.concluded:
+            expiry_ts = min(
+                expiry_ts,
+                report.updated_ts
+                + self.entry.options.get(CONF_MAX_TIME_BACK_CONCLUDED, 2) * 3600,
+            )
+
+        return expiry_ts
+
+    # ------------------------------------------------------
+    def push_traffic_report_expiry(self, report: TrafficReport) -> None:
+        """Add traffic report to the expiry heap."""
 
-        # if check_report.get("concluded", False) is True:
-        #     if (
-        #         datetime.fromisoformat(check_report["updatedTime"])
-        #         < self._max_time_back_concluded
-        #     ):
-        #         return True
+        if self.entry.options.get(CONF_MAX_TIME_BACK, 0) > 0:
+            heappush(
+                self.expiry_heap, (self.traffic_report_expiry_ts(report), report.id)
+            )
+
+    # ------------------------------------------------------
+    def remove_expiry_listener(self) -> None:
+        """Remove the listener for the next expiry."""
+
+        if self.unsub_expiry_listener is not None:
+            self.unsub_expiry_listener()
+            self.unsub_expiry_listener = None
+
+    # ------------------------------------------------------
+    def schedule_expiry_listener(self) -> None:
+        """Listen for the next traffic report to get to old."""
+
+        self.remove_expiry_listener()
+
+        # Drop entries left behind by updated or removed reports, and duplicates
+        if len(self.expiry_heap) > 2 * len(self.traffic_reports_index) + 64:
+            self.expiry_heap = [
+                (expiry_ts, report_id)
+                for expiry_ts, report_id in set(self.expiry_heap)
+                if report_id in self.traffic_reports_index
+                and self.traffic_report_expiry_ts(self.traffic_reports_index[report_id])
+                == expiry_ts
+            ]
+            heapify(self.expiry_heap)
+
+        if len(self.expiry_heap) == 0:
+            return
+
+        self.unsub_expiry_listener = async_track_point_in_utc_time(
+            self.hass,
+            self.async_handle_expiry,
+            dt_util.utc_from_timestamp(self.expiry_heap[0][0]),
+        )
+
+    # ------------------------------------------------------
+    async def async_handle_expiry(self, _now: datetime) -> None:
+        """Handle a traffic report getting to old."""
+
+        self.unsub_expiry_listener = None
+
+        await self.async_locked(self._async_expire_traffic_reports)
+
+    # ------------------------------------------------------
+    async def _async_expire_traffic_reports(self) -> None:
+        """Remove expired traffic reports and update state."""
+
+        if await self.async_remove_to_old_traffic_reports():
+            await self.async_update_state()
 
     # ------------------------------------------------------
     async def async_remove_to_old_traffic_reports(self) -> bool:
-        """Remove to old traffic report."""
+        """Remove to old traffic report.
+
+        Only the expired entries at the top of the expiry heap are visited.
+        """
 
         ret_result: bool = False
 
         # Remove reports older than max_time_back
         if self.entry.options.get(CONF_MAX_TIME_BACK, 0) > 0:
-            for idx, report in reversed(list(enumerate(self.traffic_reports))):
-                if await self.async_is_old_report(report):
-                    self.traffic_reports.pop(idx)
-                    # self.traffic_reports.remove(report)
-                    ret_result = True
+            tmp_now: float = time()
+            tmp_index: dict[str, TrafficReport] = dict(self.traffic_reports_index)
+            expired_ids: set[str] = set()
+
+            while len(self.expiry_heap) > 0 and self.expiry_heap[0][0] < tmp_now:
+                expiry_ts, report_id = heappop(self.expiry_heap)
+                report: TrafficReport | None = tmp_index.get(report_id)
+
+                # Entry left behind by an updated or removed report
+                if report is None or self.traffic_report_expiry_ts(report) != expiry_ts:
+                    continue
+
+                self.shadow_cache.put(tmp_index.pop(report_id))
+                expired_ids.add(report_id)
+
+            if len(expired_ids) > 0:
+                self.swap_traffic_reports(
+                    [
+                        report
+                        for report in self.traffic_reports
+                        if report.id not in expired_ids
+                    ],
+                    tmp_index,
+                )
+                ret_result = True
 
-            if len(self.traffic_reports) == 0:
-                self.traffic_report_rotate_pos = -1
-            elif self.traffic_report_rotate_pos >= len(self.traffic_reports):
-                self.traffic_report_rotate_pos = 0
+        self.schedule_expiry_listener()
 
         return ret_result
 
     # ------------------------------------------------------
-    def prepare_traffic_reports(self, reports: list) -> list:
-        """Prepare traffic reports."""
+    async def async_get_json(self, url: str, conditional: bool = False) -> list | None:
+        """Get json from url.
+
+        A conditional request sends the cached validators for the url and
+        returns None, if the content is not modified. A hash of the body is
+        used when the server does not send validators. New validators are
+        pending, until the caller commits them.
+        """
+
+        headers: dict = {}
+        validator: HttpValidator | None = (
+            self.http_validators.get(url) if conditional else None
+        )
+
+        if validator is not None:
+            if validator.etag:
+                headers[hdrs.IF_NONE_MATCH] = validator.etag
+            if validator.last_modified:
+                headers[hdrs.IF_MODIFIED_SINCE] = validator.last_modified
 
-        for tmp_report in reports:
-            tmp_report["region"] = str(tmp_report["region"]).lower().replace("-", "_")
-            tmp_report["type"] = str(tmp_report["type"]).lower().replace("-", "_")
+        async with timeout(self.request_timeout):
+            response = await self.session.get(url, headers=headers)
+
+            if response.status == HTTPStatus.NOT_MODIFIED:
+                return None
+
+            response.raise_for_status()
+            body: bytes = await response.read()
+
+        if conditional:
+            body_hash: int = hash(body)
+            not_modified: bool = (
+                validator is not None and validator.body_hash == body_hash
+            )
+
+            self.http_validators_pending[url] = HttpValidator(
+                etag=response.headers.get(hdrs.ETAG, ""),
+                last_modified=response.headers.get(hdrs.LAST_MODIFIED, ""),
+                body_hash=body_hash,
+            )
 
-            tmp_report["createdTime"] = (
-                dt_util.as_local(datetime.fromisoformat(tmp_report["createdTime"]))
-            ).isoformat()
-            tmp_report["updatedTime"] = (
-                dt_util.as_local(datetime.fromisoformat(tmp_report["updatedTime"]))
-            ).isoformat()
+            if not_modified:
+                return None
 
-            if tmp_report.get("updates") is not None:
-                for tmp_update in tmp_report["updates"]:
-                    tmp_update["createdTime"] = dt_util.as_local(
-                        datetime.fromisoformat(tmp_update["createdTime"])
-                    ).isoformat()
+        return json_loads(body)
 
-        return reports
+    # ------------------------------------------------------
+    def commit_http_validator(self, url: str, success: bool) -> None:
+        """Commit the pending validators for an url, or drop them on failure.
+
+        Dropping them makes the next conditional request fetch the url again.
+        """
+
+        validator: HttpValidator | None = self.http_validators_pending.pop(url, None)
+
+        if not success:
+            self.http_validators.pop(url, None)
+        elif validator is not None:
+            self.http_validators[url] = validator
 
     # ------------------------------------------------------
     @handle_retries(retries=5, retry_delay=5)
-    async def _async_get_new_traffic_reports(self, traffic_report_url: str) -> list:
-        async with timeout(self.request_timeout):
-            response = await self.session.get(traffic_report_url)
-            tmp_json: list = await response.json()
+    async def _async_get_new_traffic_reports(
+        self, traffic_report_url: str, conditional: bool = False
+    ) -> list | None:
+        return await self.async_get_json(traffic_report_url, conditional)
 
-        return tmp_json
+    # ------------------------------------------------------
+    def is_past_max_time_back(self, check_report: TrafficReport) -> bool:
+        """Check if traffic report is older than max time back."""
+
+        if self.entry.options.get(CONF_MAX_TIME_BACK, 0) == 0:
+            return False
+
+        return (
+            check_report.updated_ts
+            + self.entry.options.get(CONF_MAX_TIME_BACK, 0) * 3600
+        ) < time()
 
     # ------------------------------------------------------
-    async def async_get_new_traffic_reports(self, last_entry_date: str = "") -> bool:
-        """Get new traffic report."""
+    async def async_get_new_traffic_reports(self) -> bool:
+        """Get new traffic report.
+
+        Pages through the posts endpoint using lastPostDate, until a page
+        reaches past max time back, max row fetch is reached or the page/time
+        limits are hit.
+        """
 
-        done: bool = False
         ret_result: bool = False
+        self.traffic_reports_new_count = 0
 
         max_row_fetch: int = int(self.entry.options.get(CONF_MAX_ROW_FETCH, 0))
 
@@ -590,89 +1429,144 @@ class ComponentApi:
         region_part_url: str = ""
         transport_type_part_url: str = ""
 
-        region: list = self.entry.options.get(CONF_REGION, [])
+        # Whole region/transport type exclude rules are pushed down to the query
+        region: list = self.filter_engine.query_scopes(
+            self.entry.options.get(CONF_REGION, []), CONF_REGION_ALL, REGION_SCOPES
+        )
 
         reg: str
         for reg in region:
-            if reg != CONF_REGION_ALL:
-                region_part_url += f"regions%5B%5D={reg.upper().replace('_', '-')}&"
+            region_part_url += f"regions%5B%5D={reg.upper().replace('_', '-')}&"
 
-        transport_type: list = self.entry.options.get(CONF_TRANSPORT_TYPE, [])
+        transport_type: list = self.filter_engine.query_scopes(
+            self.entry.options.get(CONF_TRANSPORT_TYPE, []),
+            CONF_TRANSPORT_TYPE_ALL,
+            TRANSPORT_TYPE_SCOPES,
+        )
 
         for reg in transport_type:
-            if reg != CONF_TRANSPORT_TYPE_ALL:
-                transport_type_part_url += (
-                    f"type%5B%5D={reg.upper().replace('_', '-')}&"
-                )
+            transport_type_part_url += f"type%5B%5D={reg.upper().replace('_', '-')}&"
+
+        # Merged off to the side and swapped in when done, so readers never
+        # see a partially merged, sorted or trimmed list across the awaits
+        tmp_traffic_reports: list[TrafficReport] = list(self.traffic_reports)
+        tmp_index: dict[str, TrafficReport] = dict(self.traffic_reports_index)
+
+        last_entry_date: str = ""
+        first_page_url: str = ""
+        fetch_failed: bool = False
+        pages: int = 0
+        self.traffic_reports_not_modified = False
+        start_time: float = monotonic()
+
+        while (
+            pages < PAGE_FETCH_MAX
+            and (monotonic() - start_time) < PAGE_FETCH_MAX_SECONDS
+        ):
+            traffic_report_url: str = f"https://api.dr.dk/trafik/posts?{region_part_url}{transport_type_part_url}lastPostDate={last_entry_date}"
 
-        traffic_report_url: str = f"https://api.dr.dk/trafik/posts?{region_part_url}{transport_type_part_url}lastPostDate={last_entry_date}"
+            if pages == 0:
+                first_page_url = traffic_report_url
 
-        try:
-            tmp_json: list = await self._async_get_new_traffic_reports(
-                traffic_report_url
-            )
+            try:
+                # The page deadline also covers the retries of the page
+                async with timeout(PAGE_FETCH_MAX_SECONDS - (monotonic() - start_time)):
+                    # Only the first page has a stable url worth validating
+                    tmp_json: list | None = await self._async_get_new_traffic_reports(
+                        traffic_report_url, conditional=pages == 0
+                    )
 
-        except TimeoutError:
-            return False
-        except Exception as e:  # noqa: BLE001
-            Logger.error(f"Error fetching traffic reports: {e}")
-            return False
+            except TimeoutError:
+                fetch_failed = True
+                break
+            except Exception as e:  # noqa: BLE001
+                LOGGER.error("Error fetching traffic reports: %s", e)
+                fetch_failed = True
+                break
 
-        if len(tmp_json) == 0:
-            return False
+            pages += 1
 
-        last_entry_date = tmp_json[-1]["createdTime"]
+            if tmp_json is None:
+                self.traffic_reports_not_modified = True
+                break
 
-        tmp_json = self.prepare_traffic_reports(tmp_json)
+            if len(tmp_json) == 0:
+                break
 
-        if await self.async_is_old_report(tmp_json[0]):
-            return False
+            last_entry_date = tmp_json[-1]["createdTime"]
 
-        tmp_report: dict
+            tmp_reports: list[TrafficReport] = [
+                TrafficReport.from_dr(tmp_item) for tmp_item in tmp_json
+            ]
 
-        for tmp_report in tmp_json:
-            id_found: bool = False
+            if await self.async_is_old_report(tmp_reports[0]):
+                break
 
-            for idx, report in enumerate(self.traffic_reports):
-                if report["_id"] == tmp_report["_id"]:
-                    id_found = True
-                    tmp_read: bool = report.get("read", False)
-                    self.traffic_reports[idx] = tmp_report
-                    self.traffic_reports[idx]["read"] = tmp_read
-                    break
+            tmp_report: TrafficReport
 
-            if id_found:
-                continue
+            for tmp_report in tmp_reports:
+                report: TrafficReport | None = tmp_index.get(tmp_report.id)
 
-            if await self.async_is_old_report(
-                tmp_report
-            ) is False and await self.async_is_match_traffic_report(tmp_report):
-                tmp_report["read"] = False
-                self.traffic_reports.append(tmp_report)
-                ret_result = True
+                if report is not None:
+                    # Published reports are copied before they are updated
+                    if report is self.traffic_reports_index.get(report.id):
+                        report = replace(report)
+                        tmp_index[report.id] = report
 
-        self.traffic_reports.sort(key=lambda x: x["updatedTime"], reverse=True)
+                    tmp_expiry_ts: float = self.traffic_report_expiry_ts(report)
+                    report.update_from(tmp_report)
 
-        if max_row_fetch > 0 and len(self.traffic_reports) > max_row_fetch:
-            done = True
+                    # The entry already in the heap is still valid, if unchanged
+                    if self.traffic_report_expiry_ts(report) != tmp_expiry_ts:
+                        self.push_traffic_report_expiry(report)
+                    continue
 
-            for _ in range(len(self.traffic_reports) - max_row_fetch):
-                self.traffic_reports.pop()
+                if await self.async_is_old_report(
+                    tmp_report
+                ) is False and await self.async_is_match_traffic_report(tmp_report):
+                    tmp_index[tmp_report.id] = tmp_report
+                    self.push_traffic_report_expiry(tmp_report)
+                    self.shadow_cache.pop(tmp_report.id)
+                    self.traffic_reports_new_count += 1
+                    ret_result = True
+                else:
+                    self.shadow_cache.put(tmp_report)
 
-        if not done:
-            if await self.async_get_new_traffic_reports(last_entry_date) is True:
-                ret_result = True
+            tmp_traffic_reports = sorted(
+                tmp_index.values(), key=lambda x: x.updated_ts, reverse=True
+            )
+
+            if max_row_fetch > 0 and len(tmp_traffic_reports) > max_row_fetch:
+                for _ in range(len(tmp_traffic_reports) - max_row_fetch):
+                    tmp_report = tmp_traffic_reports.pop()
+                    tmp_index.pop(tmp_report.id, None)
+                    self.shadow_cache.put(tmp_report)
+                break
+
+            # Older pages can only hold reports past the cutoff
+            if self.is_past_max_time_back(tmp_reports[-1]):
+                break
+
+        # A partial merge must not let the first page validate as not modified
+        self.commit_http_validator(first_page_url, not fetch_failed)
+
+        self.shadow_cache.expire(time())
+
+        # Rendered before the swap, also to keep the relative times moving
+        # when not modified. The renders are cached.
+        await self.async_formatted_traffic_reports(tmp_traffic_reports)
+        self.swap_traffic_reports(tmp_traffic_reports, tmp_index)
+        self.traffic_reports_pages_fetched = pages
+        LOGGER.debug("Fetched %s page(s) of traffic reports", pages)
 
         return ret_result
 
     # ------------------------------------------------------
     @handle_retries(retries=5, retry_delay=5)
-    async def _async_get_important_notices(self, important_notices_url: str) -> list:
-        async with timeout(self.request_timeout):
-            response = await self.session.get(important_notices_url)
-            tmp_json: list = await response.json()
-
-        return tmp_json
+    async def _async_get_important_notices(
+        self, important_notices_url: str
+    ) -> list | None:
+        return await self.async_get_json(important_notices_url, conditional=True)
 
     # ------------------------------------------------------
     async def async_get_important_notices(self) -> bool:
@@ -681,28 +1575,39 @@ class ComponentApi:
         ret_result: bool = False
 
         important_notices_url: str = "https://api.dr.dk/trafik/notices"
+        self.important_notices_not_modified = False
 
         try:
-            tmp_json: list = await self._async_get_important_notices(
+            tmp_json: list | None = await self._async_get_important_notices(
                 important_notices_url
             )
 
         except TimeoutError:
+            self.commit_http_validator(important_notices_url, False)
             return False
         except Exception as e:  # noqa: BLE001
-            Logger.error(f"Error fetching important notices: {e}")
+            LOGGER.error("Error fetching important notices: %s", e)
+            self.commit_http_validator(important_notices_url, False)
+            return False
+
+        self.commit_http_validator(important_notices_url, True)
+
+        if tmp_json is None:
+            self.important_notices_not_modified = True
             return False
 
         if len(tmp_json) == 0:
             self.important_notices.clear()
             return False
 
-        for tmp_notice in reversed(tmp_json):
+        for tmp_item in reversed(tmp_json):
+            tmp_notice: ImportantNotice = ImportantNotice.from_dr(tmp_item)
             id_found: bool = False
 
             for report in self.important_notices:
-                if (report["_id"] + report["updatedTime"]) == (
-                    tmp_notice["_id"] + tmp_notice["updatedTime"]
+                if (report.id, report.updated_time) == (
+                    tmp_notice.id,
+                    tmp_notice.updated_time,
                 ):
                     id_found = True
                     break
@@ -711,7 +1616,6 @@ class ComponentApi:
                 continue
 
             self.important_notices.insert(0, tmp_notice)
-            self.important_notices[0]["read"] = False
             ret_result = True
 
         # Remove important notices older than max_time_back
@@ -724,65 +1628,127 @@ class ComponentApi:
 
         return ret_result
 
-    # ------------------------------------------------------
-    def get_read_count(self, reports: list) -> int:
-        """Get read count."""
-        x: int = len([report for report in reports if report.get("read", False)])
-        return x
+    # ------------------------------------------------------------------
+    @property
+    def traffic_reports_read_count(self) -> int:
+        """Number of read traffic reports."""
+
+        return len(self.traffic_reports) - len(self.unread_positions)
+
+    # ------------------------------------------------------------------
+    def swap_traffic_reports(
+        self, reports: list[TrafficReport], index: dict[str, TrafficReport]
+    ) -> None:
+        """Swap in a new list of traffic reports, built off to the side.
+
+        The list is never changed in place across an await. Read flags set
+        on replaced reports, while the new list was built, are carried over.
+        The rotation position follows the report it pointed at, or is moved
+        into range.
+        """
+
+        for report in reports:
+            current: TrafficReport | None = self.traffic_reports_index.get(report.id)
+
+            if current is not None and current is not report:
+                report.read = current.read
+
+        rotating_id: str | None = (
+            self.traffic_reports[self.traffic_report_rotate_pos].id
+            if 0 <= self.traffic_report_rotate_pos < len(self.traffic_reports)
+            else None
+        )
+
+        self.traffic_reports = reports
+        self.traffic_reports_index = index
+        self.rebuild_unread_positions()
+
+        if len(reports) == 0:
+            self.traffic_report_rotate_pos = -1
+        elif rotating_id is not None and rotating_id in index:
+            self.traffic_report_rotate_pos = reports.index(index[rotating_id])
+        elif self.traffic_report_rotate_pos >= len(reports):
+            self.traffic_report_rotate_pos = 0
+
+    # ------------------------------------------------------------------
+    def rebuild_unread_positions(self) -> None:
+        """Rebuild unread positions, after the traffic reports are reordered."""
+
+        self.unread_positions = [
+            idx for idx, report in enumerate(self.traffic_reports) if not report.read
+        ]
+        self.storage.marked_as_read = self.traffic_reports_read_count
+
+    # ------------------------------------------------------------------
+    def set_traffic_report_read(self, pos: int, read: bool) -> None:
+        """Set read flag of the traffic report at pos."""
+
+        report: TrafficReport = self.traffic_reports[pos]
+
+        if report.read == read:
+            return
+
+        report.read = read
+        idx: int = bisect_left(self.unread_positions, pos)
+
+        if read:
+            del self.unread_positions[idx]
+        else:
+            self.unread_positions.insert(idx, pos)
+
+        self.storage.marked_as_read = self.traffic_reports_read_count
 
     # ------------------------------------------------------------------
     def mark_all_traffic_reports_as_read(self) -> None:
         """Mark all traffic reports as read."""
 
         for report in self.traffic_reports:
-            self.mark_traffic_report_as_read(report)
+            report.read = True
 
-        self.storage.marked_as_read = len(self.traffic_reports)
+        self.rebuild_unread_positions()
 
     # ------------------------------------------------------------------
     def unmark_all_traffic_reports_as_read(self) -> None:
         """Unmark all traffic reports as read."""
 
         for report in self.traffic_reports:
-            self.unmark_traffic_report_as_read(report)
+            report.read = False
 
-        self.storage.marked_as_read = len(self.traffic_reports)
+        self.rebuild_unread_positions()
 
     # ------------------------------------------------------------------
-    def mark_traffic_report_as_read(self, report: dict | int) -> None:
+    def mark_traffic_report_as_read(self, report: TrafficReport | int) -> None:
         """Mark report as read."""
 
-        if isinstance(report, dict):
-            report["read"] = True
+        if isinstance(report, TrafficReport):
+            report.read = True
+            self.rebuild_unread_positions()
         elif isinstance(report, int) and report < len(self.traffic_reports):
-            self.traffic_reports[report]["read"] = True
+            self.set_traffic_report_read(report, True)
 
     # ------------------------------------------------------------------
-    def unmark_traffic_report_as_read(self, report: dict | int) -> None:
+    def unmark_traffic_report_as_read(self, report: TrafficReport | int) -> None:
         """Unmark report as read."""
 
-        if isinstance(report, dict):
-            report["read"] = False
+        if isinstance(report, TrafficReport):
+            report.read = False
+            self.rebuild_unread_positions()
         elif isinstance(report, int) and report < len(self.traffic_reports):
-            self.traffic_reports[report]["read"] = False
+            self.set_traffic_report_read(report, False)
 
     # ------------------------------------------------------------------
     def mark_current_traffic_report_as_read(self) -> None:
         """Mark report as read."""
 
         if self.traffic_report_rotate_pos > -1:
-            self.traffic_reports[self.traffic_report_rotate_pos]["read"] = True
-
-        self.storage.marked_as_read = self.get_read_count(self.traffic_reports)
+            self.set_traffic_report_read(self.traffic_report_rotate_pos, True)
 
     # ------------------------------------------------------------------
     def unmark_current_traffic_report_as_read(self) -> None:
         """Unmark report as read."""
 
         if self.traffic_report_rotate_pos > -1:
-            self.traffic_reports[self.traffic_report_rotate_pos]["read"] = False
-
-        self.storage.marked_as_read = self.get_read_count(self.traffic_reports)
+            self.set_traffic_report_read(self.traffic_report_rotate_pos, False)
 
     # ------------------------------------------------------------------
     def mark_all_important_notices_as_read(self) -> None:
@@ -799,70 +1765,70 @@ class ComponentApi:
             self.unmark_important_notice_as_read(report)
 
     # ------------------------------------------------------------------
-    def mark_important_notice_as_read(self, report: dict | int) -> None:
+    def mark_important_notice_as_read(self, report: ImportantNotice | int) -> None:
         """Mark report as read."""
 
-        if isinstance(report, dict):
-            report["read"] = True
+        if isinstance(report, ImportantNotice):
+            report.read = True
         elif isinstance(report, int) and report < len(self.important_notices):
-            self.important_notices[report]["read"] = True
+            self.important_notices[report].read = True
 
     # ------------------------------------------------------------------
-    def unmark_important_notice_as_read(self, report: dict | int) -> None:
+    def unmark_important_notice_as_read(self, report: ImportantNotice | int) -> None:
         """Unmark report as read."""
 
-        if isinstance(report, dict):
-            report["read"] = False
+        if isinstance(report, ImportantNotice):
+            report.read = False
         elif isinstance(report, int) and report < len(self.important_notices):
-            self.important_notices[report]["read"] = False
+            self.important_notices[report].read = False
 
     # ------------------------------------------------------------------
     def get_next_traffic_report_pos(self, start_pos: int = 0) -> int:
-        """Get next traffic report position."""
+        """Get next traffic report position.
 
-        if (
-            len(self.traffic_reports) == 0
-            or all(value.get("read", False) for value in self.traffic_reports)
-            or (len(self.traffic_reports) - 1) < start_pos
-        ):
+        Rotates through the unread positions from start_pos and on.
+        """
+
+        first_idx: int = bisect_left(self.unread_positions, start_pos)
+
+        if first_idx == len(self.unread_positions):
             self.traffic_report_rotate_pos = -1
 
-        # elif len(self.traffic_reports) == 1:
-        #     self.traffic_report_rotate_pos = 0
         else:
             if self.traffic_report_rotate_pos == -1:
                 self.traffic_report_rotate_pos = start_pos - 1
 
-            self.traffic_report_rotate_pos += 1
+            idx: int = bisect_right(
+                self.unread_positions, self.traffic_report_rotate_pos
+            )
 
-            if self.traffic_report_rotate_pos > (len(self.traffic_reports) - 1):
-                self.traffic_report_rotate_pos = start_pos
+            if idx < first_idx or idx == len(self.unread_positions):
+                idx = first_idx
 
-            if self.traffic_reports[self.traffic_report_rotate_pos].get("read", False):
-                self.get_next_traffic_report_pos(start_pos)
+            self.traffic_report_rotate_pos = self.unread_positions[idx]
 
         return self.traffic_report_rotate_pos
 
     # ------------------------------------------------------------------
     def get_prev_traffic_report_pos(self, start_pos: int = 0) -> int:
-        """Get previous traffic report position."""
+        """Get previous traffic report position.
 
-        if (
-            len(self.traffic_reports) == 0
-            or all(value.get("read", False) for value in self.traffic_reports)
-            or (len(self.traffic_reports) - 1) < start_pos
-        ):
+        Rotates backwards through the unread positions from start_pos and on.
+        """
+
+        first_idx: int = bisect_left(self.unread_positions, start_pos)
+
+        if first_idx == len(self.unread_positions):
             self.traffic_report_rotate_pos = -1
 
-        # elif len(self.traffic_reports) == 1:
-        #     self.traffic_report_rotate_pos = 0
         else:
-            self.traffic_report_rotate_pos -= 1
+            idx: int = (
+                bisect_left(self.unread_positions, self.traffic_report_rotate_pos) - 1
+            )
 
-            if self.traffic_report_rotate_pos < start_pos:
-                self.traffic_report_rotate_pos = len(self.traffic_reports) - 1
+            if idx < first_idx:
+                idx = len(self.unread_positions) - 1
 
-            if self.traffic_reports[self.traffic_report_rotate_pos].get("read", False):
-                self.get_prev_traffic_report_pos(start_pos)
+            self.traffic_report_rotate_pos = self.unread_positions[idx]
 
         return self.traffic_report_rotate_pos
@@ -10,6 +10,7 @@ import voluptuous as vol
 from homeassistant.helpers.schema_config_entry_flow import (
     SchemaCommonFlowHandler,
     SchemaConfigFlowHandler,
+    SchemaFlowError,
     SchemaFlowFormStep,
 )
 from homeassistant.helpers.selector import (
@@ -29,10 +30,14 @@ from homeassistant.helpers.selector import (
 # from homeassistant.data_entry_flow import section
 #  from homeassistant import config_entries
 from .const import (
+    CONF_BATCH_EVENTS,
+    CONF_BATCH_EVENTS_WINDOW,
+    CONF_EXCLUDE_LIST,
     CONF_INCL_LATEST_IN_PREVIOUS_TRAFFIC_REPORTS,
     CONF_LISTEN_TO_TIMER_TRIGGER,
     CONF_MATCH_CASE,
     CONF_MATCH_LIST,
+    CONF_MATCH_UPDATES,
     CONF_MATCH_WORD,
     CONF_MAX_ROW_FETCH,
     CONF_MAX_TIME_BACK,
@@ -52,6 +57,8 @@ from .const import (
     CONF_TRANSPORT_TYPE_ALL,
     CONF_TRANSPORT_TYPE_PRIVATE,
     CONF_TRANSPORT_TYPE_PUBLIC,
+    CONF_UPDATE_INTERVAL_MAX,
+    CONF_UPDATE_INTERVAL_MIN,
     DOMAIN,
     DOMAIN_NAME,
     TRANSLATION_KEY_REGION,
@@ -75,6 +82,20 @@ async def _validate_input(
     return user_input
 
 
+# ------------------------------------------------------------------
+async def _validate_input_extra(
+    handler: SchemaCommonFlowHandler, user_input: dict[str, Any]
+) -> dict[str, Any]:
+    """Validate the user input for the extra step."""
+
+    if user_input.get(CONF_UPDATE_INTERVAL_MIN, 1) > user_input.get(
+        CONF_UPDATE_INTERVAL_MAX, 10
+    ):
+        raise SchemaFlowError("update_interval_min_max")
+
+    return user_input
+
+
 CONFIG_OPTIONS_SCHEMA = vol.Schema(
     {
         vol.Required(CONF_REGION, default=[CONF_REGION_ALL]): SelectSelector(
@@ -170,6 +191,10 @@ CONFIG_OPTIONS_SCHEMA_MATCH = vol.Schema(
         ),
         vol.Optional(CONF_MATCH_CASE, default=False): BooleanSelector(),
         vol.Optional(CONF_MATCH_WORD, default=False): BooleanSelector(),
+        vol.Optional(CONF_EXCLUDE_LIST, default=[]): TextSelector(
+            TextSelectorConfig(multiple=True)
+        ),
+        vol.Optional(CONF_MATCH_UPDATES, default=False): BooleanSelector(),
     }
 )
 
@@ -189,6 +214,43 @@ CONFIG_OPTIONS_SCHEMA_EXTRA = vol.Schema(
         vol.Optional(
             CONF_OVERVIEW_PREVIOUS_TRAFFIC_REPORTS, default=True
         ): BooleanSelector(),
+        vol.Optional(
+            CONF_UPDATE_INTERVAL_MIN,
+            default=1,
+        ): NumberSelector(
+            NumberSelectorConfig(
+                min=0.5,
+                max=60,
+                step=0.5,
+                mode=NumberSelectorMode.BOX,
+                unit_of_measurement="minutter",
+            )
+        ),
+        vol.Optional(
+            CONF_UPDATE_INTERVAL_MAX,
+            default=10,
+        ): NumberSelector(
+            NumberSelectorConfig(
+                min=0.5,
+                max=60,
+                step=0.5,
+                mode=NumberSelectorMode.BOX,
+                unit_of_measurement="minutter",
+            )
+        ),
+        vol.Optional(CONF_BATCH_EVENTS, default=False): BooleanSelector(),
+        vol.Optional(
+            CONF_BATCH_EVENTS_WINDOW,
+            default=0,
+        ): NumberSelector(
+            NumberSelectorConfig(
+                min=0,
+                max=600,
+                step=5,
+                mode=NumberSelectorMode.BOX,
+                unit_of_measurement="sekunder",
+            )
+        ),
     }
 )
 
@@ -205,7 +267,7 @@ CONFIG_FLOW = {
     ),
     "user_extra": SchemaFlowFormStep(
         CONFIG_OPTIONS_SCHEMA_EXTRA,
-        validate_user_input=_validate_input,
+        validate_user_input=_validate_input_extra,
     ),
 }
 
@@ -222,7 +284,7 @@ OPTIONS_FLOW = {
     ),
     "init_extra": SchemaFlowFormStep(
         CONFIG_OPTIONS_SCHEMA_EXTRA,
-        validate_user_input=_validate_input,
+        validate_user_input=_validate_input_extra,
     ),
 }
 
@@ -43,6 +43,11 @@ DICT_TRANSPORT_TYPE = {
 CONF_MAX_TIME_BACK = "max_time_back"
 CONF_MAX_TIME_BACK_CONCLUDED = "max_time_back_concluded"
 CONF_MAX_ROW_FETCH = "max_row_fetch"
+PAGE_FETCH_MAX = 10
+PAGE_FETCH_MAX_SECONDS = 60
+RENDER_CACHE_MAX_SIZE = 256
+RELATIVE_TIME_BUCKET_SECONDS = 30
+RELATIVE_TIME_CACHE_MAX_SIZE = 1024
 CONF_ONLY_SHOW_LAST_UPDATE = "only_show_last_update"
 CONF_RESTART_TIMER = "restart_timer"
 CONF_LISTEN_TO_TIMER_TRIGGER = "listen_to_timer_trigger"
@@ -58,9 +63,57 @@ CONF_MATCH = "match"
 CONF_MATCH_CASE = "match_case"
 CONF_MATCH_WORD = "match_word"
 CONF_MATCH_LIST = "match_list"
+CONF_EXCLUDE_LIST = "exclude_list"
+CONF_MATCH_UPDATES = "match_updates"
+KEYWORD_MATCHER_MIN_WORDS = 50
+MATCH_VERDICT_CACHE_MAX_SIZE = 1024
+SHADOW_CACHE_MAX_SIZE = 500
+SHADOW_CACHE_MAX_BYTES = 512 * 1024
+# Max value of the max time back options
+SHADOW_CACHE_MAX_AGE_HOURS = 48
 
-STORAGE_VERSION = 1
+# Option changes that can not be applied without reloading the entry
+OPTIONS_RELOAD = (
+    CONF_REGION,
+    CONF_TRANSPORT_TYPE,
+    CONF_LISTEN_TO_TIMER_TRIGGER,
+    CONF_RESTART_TIMER,
+)
+# Option changes that need the cached traffic reports to be filtered again
+OPTIONS_REFILTER = (
+    CONF_MAX_TIME_BACK,
+    CONF_MAX_TIME_BACK_CONCLUDED,
+    CONF_MAX_ROW_FETCH,
+    CONF_MATCH_CASE,
+    CONF_MATCH_WORD,
+    CONF_MATCH_LIST,
+    CONF_EXCLUDE_LIST,
+    CONF_MATCH_UPDATES,
+)
+
+UPDATE_INTERVAL_SECONDS = 120
+CONF_UPDATE_INTERVAL_MIN = "update_interval_min"
+CONF_UPDATE_INTERVAL_MAX = "update_interval_max"
+POLL_BURST_NEW_REPORTS = 3
+POLL_EMPTY_STREAK = 3
+# Local (start, end) hours, rush hours on weekdays only
+POLL_RUSH_HOURS = ((6, 9), (15, 18))
+POLL_NIGHT_HOURS = ((0, 5), (23, 24))
+
+CONF_BATCH_EVENTS = "batch_events"
+CONF_BATCH_EVENTS_WINDOW = "batch_events_window"
+
+STORAGE_VERSION = 2
 STORAGE_KEY = DOMAIN
+STORAGE_WRITE_DELAY = 10
+SNAPSHOT_STORAGE_VERSION = 1
+SNAPSHOT_STORAGE_KEY = DOMAIN + "_snapshot"
+SNAPSHOT_WRITE_DELAY = 30
+SNAPSHOT_MAX_AGE_HOURS = 24
+TRAFFIC_REPORTS_LAST_ID_COMPACT_INTERVAL = 3600
+# Max value of the max time back options
+TRAFFIC_REPORTS_LAST_ID_RETENTION_HOURS = 48
 
 EVENT_NEW_TRAFFIC_REPORT = "new_traffic_report"
+EVENT_NEW_TRAFFIC_REPORTS = "new_traffic_reports"
 EVENT_NEW_IMPORTANT_NOTICE = "new_important_notice"
@@ -0,0 +1,69 @@
+"""Diagnostics support for Trafikmeldinger."""
+
+from __future__ import annotations
+
+from typing import Any
+
+from homeassistant.core import HomeAssistant
+
+from . import CommonConfigEntry
+from .component_api import ComponentApi
+
+
+# ------------------------------------------------------
+async def async_get_config_entry_diagnostics(
+    hass: HomeAssistant, entry: CommonConfigEntry
+) -> dict[str, Any]:
+    """Return diagnostics for a config entry."""
+
+    component_api: ComponentApi = entry.runtime_data.component_api
+
+    return {
+        "options": dict(entry.options),
+        "traffic_reports": len(component_api.traffic_reports),
+        "important_notices": len(component_api.important_notices),
+        "traffic_reports_pages_fetched": component_api.traffic_reports_pages_fetched,
+        "snapshot_restored": component_api.snapshot_restored,
+        "first_refresh_seconds": component_api.first_refresh_seconds,
+        "poll": {
+            "interval_seconds": component_api.poll_policy.interval_seconds,
+            "reason": component_api.poll_policy.reason,
+            "empty_streak": component_api.poll_policy.empty_streak,
+        },
+        "state": {
+            "generation": component_api.generation,
+            "writes": component_api.state_writes,
+            "writes_skipped": component_api.state_writes_skipped,
+        },
+        "events": {
+            "fired": component_api.events_fired,
+            "saved": component_api.events_saved,
+            "batch_sequence": component_api.event_batch_sequence,
+            "batch_pending": len(component_api.event_batch),
+        },
+        "render_cache": {
+            "size": len(component_api.render_cache),
+            "hits": component_api.render_cache_hits,
+            "misses": component_api.render_cache_misses,
+        },
+        "single_flight": {
+            "started": component_api.single_flight_started,
+            "coalesced": component_api.single_flight_coalesced,
+        },
+        "shadow_cache": {
+            "size": len(component_api.shadow_cache),
+            "bytes": component_api.shadow_cache.bytes,
+            "max_size": component_api.shadow_cache.max_size,
+            "max_bytes": component_api.shadow_cache.max_bytes,
+            "evictions": component_api.shadow_cache.evictions,
+            "expirations": component_api.shadow_cache.expirations,
+        },
+        "storage": {
+            "write_requests": component_api.storage.write_requests,
+            "writes": component_api.storage.writes,
+            "traffic_reports_last_id": len(
+                component_api.storage.traffic_reports_last_id
+            ),
+            "traffic_reports_last_id_compacted": component_api.last_id_compacted,
+        },
+    }
@@ -2,7 +2,10 @@
 
 from __future__ import annotations
 
+from typing import Any
+
 from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import callback
 from homeassistant.helpers.device_registry import DeviceEntryType
 from homeassistant.helpers.entity import DeviceInfo, Entity
 from homeassistant.helpers.update_coordinator import (
@@ -10,11 +13,18 @@ from homeassistant.helpers.update_coordinator import (
     DataUpdateCoordinator,
 )
 
+from .component_api import ComponentApi
 from .const import DOMAIN, DOMAIN_NAME
+from .report_model import TrafficSnapshot
 
 
 class ComponentEntity(CoordinatorEntity[DataUpdateCoordinator], Entity):
-    """Defines a Trafikmeldinger entity."""
+    """Defines a Trafikmeldinger entity.
+
+    State and attributes are computed once per snapshot generation, and
+    the state is only written, when the generation or availability changed
+    and the computed state differs from the last written.
+    """
 
     _attr_has_entity_name = True
 
@@ -33,3 +43,76 @@ class ComponentEntity(CoordinatorEntity[DataUpdateCoordinator], Entity):
             sw_version="1.0",
             name=DOMAIN_NAME,
         )
+
+        self.component_api: ComponentApi = entry.runtime_data.component_api
+
+        self.computed_generation: int | None = None
+        self.computed_value: str | None = None
+        self.computed_attributes: dict = {}
+
+        self.written_key: tuple[int, bool] | None = None
+        self.written_state: tuple[Any, ...] | None = None
+
+    # ------------------------------------------------------
+    def compute_state(self, data: TrafficSnapshot) -> tuple[str | None, dict]:
+        """Compute native value and extra state attributes from a snapshot."""
+
+        return None, {}
+
+    # ------------------------------------------------------
+    def computed(self) -> tuple[str | None, dict]:
+        """Native value and extra state attributes of the current generation."""
+
+        data: TrafficSnapshot = self.coordinator.data
+
+        if self.computed_generation != data.generation:
+            self.computed_value, self.computed_attributes = self.compute_state(data)
+            self.computed_generation = data.generation
+
+        return self.computed_value, self.computed_attributes
+
+    # ------------------------------------------------------
+    @property
+    def native_value(self) -> str | None:
+        """Native value.
+
+        Returns:
+            str | None: Native value
+
+        """
+        return self.computed()[0]
+
+    # ------------------------------------------------------
+    @property
+    def extra_state_attributes(self) -> dict:
+        """Extra state attributes.
+
+        Returns:
+            dict: Extra state attributes
+
+        """
+        return self.computed()[1]
+
+    # ------------------------------------------------------
+    @callback
+    def async_write_ha_state_if_changed(self) -> None:
+        """Write the state, unless it is unchanged since the last write."""
+
+        key: tuple[int, bool] = (self.coordinator.data.generation, self.available)
+
+        if key == self.written_key:
+            self.component_api.state_writes_skipped += 1
+            return
+
+        self.written_key = key
+
+        tmp_value, tmp_attributes = self.computed()
+        state: tuple[Any, ...] = (self.available, tmp_value, tmp_attributes)
+
+        if state == self.written_state:
+            self.component_api.state_writes_skipped += 1
+            return
+
+        self.written_state = state
+        self.component_api.state_writes += 1
+        self.async_write_ha_state()
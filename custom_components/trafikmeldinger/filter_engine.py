@@ -0,0 +1,191 @@
+"""Filter engine for Trafikmeldinger."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from re import Pattern
+
+from .const import (
+    CONF_REGION_ALL,
+    CONF_TRANSPORT_TYPE_ALL,
+    DICT_REGION,
+    DICT_TRANSPORT_TYPE,
+)
+from .keyword_matcher import KeywordMatcher, compile_any_word_matcher
+from .report_model import TrafficReport
+
+GLOBAL_SCOPE = ""
+REGION_SCOPES: frozenset[str] = frozenset(DICT_REGION) - {CONF_REGION_ALL}
+TRANSPORT_TYPE_SCOPES: frozenset[str] = frozenset(DICT_TRANSPORT_TYPE) - {
+    CONF_TRANSPORT_TYPE_ALL
+}
+RULE_SCOPES: frozenset[str] = REGION_SCOPES | TRANSPORT_TYPE_SCOPES
+
+
+# ------------------------------------------------------------------
+# ------------------------------------------------------------------
+@dataclass(slots=True)
+class CompiledFilter:
+    """Filter compiled for one region and transport type."""
+
+    rejected: bool
+    include_all: bool
+    include: Pattern[str] | KeywordMatcher | None
+    exclude: Pattern[str] | KeywordMatcher | None
+
+
+# ------------------------------------------------------------------
+# ------------------------------------------------------------------
+class FilterEngine:
+    """Rule based filter for traffic reports.
+
+    A rule is a term, or a term scoped to a region or transport type
+    written as `<scope>:<term>`, e.g. `cph:Motorring 3`. A scope without a
+    term, e.g. `south:`, covers the whole region or transport type.
+
+    A report matches if any include rule for its scope matches, or there
+    are no include rules for its scope, and no exclude rule matches.
+    """
+
+    def __init__(
+        self,
+        include_list: list[str],
+        exclude_list: list[str],
+        use_word_boundaries: bool = True,
+        case_sensitive: bool = False,
+        match_updates: bool = False,
+    ) -> None:
+        """Init."""
+
+        self.use_word_boundaries: bool = use_word_boundaries
+        self.case_sensitive: bool = case_sensitive
+        self.match_updates: bool = match_updates
+
+        self.include_rules: dict[str, list[str]]
+        self.include_scopes: set[str]
+        self.include_rules, self.include_scopes = self.parse_rules(include_list)
+
+        self.exclude_rules: dict[str, list[str]]
+        self.exclude_scopes: set[str]
+        self.exclude_rules, self.exclude_scopes = self.parse_rules(exclude_list)
+
+        self.compiled: dict[tuple[str, str], CompiledFilter] = {}
+
+    # ------------------------------------------------------------------
+    @staticmethod
+    def parse_rules(rules: list[str]) -> tuple[dict[str, list[str]], set[str]]:
+        """Parse rules into terms per scope and whole scopes."""
+
+        terms: dict[str, list[str]] = {}
+        whole_scopes: set[str] = set()
+
+        for rule in rules:
+            if rule.strip() == "":
+                continue
+
+            scope, sep, term = rule.partition(":")
+            scope = scope.strip().lower()
+
+            if sep == "" or scope not in RULE_SCOPES:
+                terms.setdefault(GLOBAL_SCOPE, []).append(rule)
+            elif term.strip() == "":
+                whole_scopes.add(scope)
+            else:
+                terms.setdefault(scope, []).append(term.strip())
+
+        return terms, whole_scopes
+
+    # ------------------------------------------------------------------
+    @property
+    def is_empty(self) -> bool:
+        """Check if there are no rules."""
+
+        return not (
+            self.include_rules
+            or self.include_scopes
+            or self.exclude_rules
+            or self.exclude_scopes
+        )
+
+    # ------------------------------------------------------------------
+    def compile(self, region: str, transport_type: str) -> CompiledFilter:
+        """Compile the rules for a region and transport type."""
+
+        scopes: tuple[str, ...] = (GLOBAL_SCOPE, region, transport_type)
+
+        include_terms: list[str] = [
+            term for scope in scopes for term in self.include_rules.get(scope, [])
+        ]
+        exclude_terms: list[str] = [
+            term for scope in scopes for term in self.exclude_rules.get(scope, [])
+        ]
+
+        return CompiledFilter(
+            rejected=(
+                region in self.exclude_scopes or transport_type in self.exclude_scopes
+            ),
+            include_all=(
+                len(include_terms) == 0
+                or region in self.include_scopes
+                or transport_type in self.include_scopes
+            ),
+            include=compile_any_word_matcher(
+                include_terms, self.use_word_boundaries, self.case_sensitive
+            ),
+            exclude=compile_any_word_matcher(
+                exclude_terms, self.use_word_boundaries, self.case_sensitive
+            ),
+        )
+
+    # ------------------------------------------------------------------
+    def is_match(self, report: TrafficReport) -> bool:
+        """Check if traffic report is a match."""
+
+        compiled: CompiledFilter | None = self.compiled.get(
+            (report.region, report.type)
+        )
+
+        if compiled is None:
+            compiled = self.compile(report.region, report.type)
+            self.compiled[(report.region, report.type)] = compiled
+
+        if compiled.rejected:
+            return False
+
+        if compiled.include_all and compiled.exclude is None:
+            return True
+
+        tmp_txt: str = report.text + report.reference_text
+
+        if self.match_updates:
+            for update in report.updates:
+                tmp_txt += "\n" + update.text
+
+        if not compiled.include_all and not compiled.include.search(tmp_txt):
+            return False
+
+        return compiled.exclude is None or not compiled.exclude.search(tmp_txt)
+
+    # ------------------------------------------------------------------
+    def query_scopes(
+        self, selected: list[str], all_key: str, scopes: frozenset[str]
+    ) -> list[str]:
+        """Push whole scope exclude rules down to the query selection.
+
+        Returns the selection to query, an empty selection queries all.
+        """
+
+        tmp_selected: list[str] = [scope for scope in selected if scope != all_key]
+
+        if len(tmp_selected) == 0:
+            tmp_selected = sorted(scopes)
+
+        tmp_remaining: list[str] = [
+            scope for scope in tmp_selected if scope not in self.exclude_scopes
+        ]
+
+        # Nothing excluded, or nothing left to query
+        if len(tmp_remaining) in (0, len(tmp_selected)):
+            return [scope for scope in selected if scope != all_key]
+
+        return tmp_remaining
@@ -11,6 +11,7 @@ import jsonpickle
 
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers.storage import Store
+from homeassistant.util.json import json_loads
 
 
 # ------------------------------------------------------------------
@@ -48,9 +49,15 @@ class StorageJson:
 
     This class is used to store data in a json file.
 
+    Subclasses declaring storage_fields are stored as a plain dict of those
+    fields, serialized by the Store with orjson. Other subclasses are
+    stored with jsonpickle.
+
     External imports: jsonpickle
     """
 
+    storage_fields: tuple[str, ...] = ()
+
     def __init__(
         self,
         hass: HomeAssistant,
@@ -58,6 +65,7 @@ class StorageJson:
         version: int = 1,
         minor_version: int = 1,
         async_migrate_func: Callable[[int, int, Any], Any] | None = None,
+        write_delay: float = 0,
     ) -> None:
         """Init."""
 
@@ -71,8 +79,17 @@ class StorageJson:
             minor_version=minor_version,
         )
         self.store___.custom_migrate_func = async_migrate_func
+
+        if async_migrate_func is None and self.storage_fields:
+            self.store___.custom_migrate_func = self.migrate_jsonpickle_data
         self.base_class___ = self.__class__ is StorageJson
 
+        self.write_delay___: float = write_delay
+        self.dirty___: bool = False
+        self.delayed_extra_data___: dict | None = None
+        self.write_requests___: int = 0
+        self.writes___: int = 0
+
     # ------------------------------------------------------------------
     async def async_read_settings(self) -> dict | None:
         """read_settings."""
@@ -84,6 +101,9 @@ class StorageJson:
         if data is None:
             return None
 
+        if self.storage_fields:
+            return self.decode_fields(data)
+
         if type(data) is dict:
             if self.DICT_KEY___ in data:
                 jsonpickle.set_encoder_options("json", ensure_ascii=False)
@@ -108,27 +128,138 @@ class StorageJson:
         return jsonpickle.decode(data)
 
     # ------------------------------------------------------------------
-    async def async_write_settings(self, extra_data: dict = {}) -> None:
+    async def async_write_settings(self, extra_data: dict | None = None) -> None:
         """Write settings."""
 
-        jsonpickle.set_encoder_options("json", ensure_ascii=False)
+        self.write_requests___ += 1
+        await self.store___.async_save(self.data_to_write(extra_data))
+
+    # ------------------------------------------------------------------
+    def delay_write_settings(self, extra_data: dict | None = None) -> None:
+        """Write settings after the write delay.
+
+        Requests within the delay are coalesced into one write. Pending
+        writes are flushed by the Store when Home Assistant stops.
+        """
+
+        self.write_requests___ += 1
+        self.dirty___ = True
+        self.delayed_extra_data___ = extra_data
+        self.store___.async_delay_save(self.delayed_data_to_write, self.write_delay___)
+
+    # ------------------------------------------------------------------
+    async def async_flush_settings(self) -> None:
+        """Write pending delayed settings now."""
+
+        if self.dirty___:
+            await self.store___.async_save(self.delayed_data_to_write())
+
+    # ------------------------------------------------------------------
+    def delayed_data_to_write(self) -> dict:
+        """Data to write for a delayed write."""
+        return self.data_to_write(self.delayed_extra_data___)
+
+    # ------------------------------------------------------------------
+    def data_to_write(self, extra_data: dict | None = None) -> dict:
+        """Data to write."""
+
+        if extra_data is None:
+            extra_data = {}
+
+        self.dirty___ = False
+        self.writes___ += 1
+
+        if self.storage_fields:
+            return {**self.encode_fields(), **extra_data}
 
         if self.base_class___:
-            await self.store___.async_save(extra_data)
+            return extra_data
 
-        else:
-            await self.store___.async_save(
-                {self.DICT_KEY___: self.encode_data(self), **extra_data}
-            )
+        jsonpickle.set_encoder_options("json", ensure_ascii=False)
+        return {self.DICT_KEY___: self.encode_data(self), **extra_data}
+
+    # ------------------------------------------------------------------
+    @property
+    def write_requests(self) -> int:
+        """Number of write requests."""
+        return self.write_requests___
+
+    # ------------------------------------------------------------------
+    @property
+    def writes(self) -> int:
+        """Number of writes."""
+        return self.writes___
 
     # ------------------------------------------------------------------
     def encode_data(self, data: Any):
         """Encode data."""
         return jsonpickle.encode(data, unpicklable=True)
 
+    # ------------------------------------------------------------------
+    def encode_fields(self) -> dict:
+        """Encode the declared storage fields."""
+        return {field: getattr(self, field) for field in self.storage_fields}
+
+    # ------------------------------------------------------------------
+    def decode_fields(self, data: dict) -> dict | None:
+        """Decode the declared storage fields.
+
+        Values not matching the type of the current value are skipped. Returns
+        the remaining data, if any.
+        """
+
+        tmp_dict: dict = dict(data)
+
+        for field in self.storage_fields:
+            if field not in tmp_dict:
+                continue
+
+            value = tmp_dict.pop(field)
+
+            if isinstance(value, type(getattr(self, field))):
+                setattr(self, field, value)
+
+        if len(tmp_dict) > 0:
+            return tmp_dict
+
+        return None
+
+    # ------------------------------------------------------------------
+    def migrate_jsonpickle_data(
+        self,
+        old_major_version: int,
+        old_minor_version: int,
+        old_data: Any,
+    ) -> Any:
+        """Migrate data stored with jsonpickle to the declared storage fields."""
+
+        if type(old_data) is not dict or self.DICT_KEY___ not in old_data:
+            return old_data
+
+        tmp_data: dict = dict(old_data)
+        tmp_obj = json_loads(tmp_data.pop(self.DICT_KEY___))
+
+        # State returned by __getstate__ is stored under py/state
+        if type(tmp_obj) is dict and "py/state" in tmp_obj:
+            tmp_obj = tmp_obj["py/state"]
+
+        if type(tmp_obj) is dict:
+            tmp_data.update(
+                {
+                    field: value
+                    for field, value in tmp_obj.items()
+                    if field in self.storage_fields
+                }
+            )
+
+        return tmp_data
+
     # ------------------------------------------------------------------
     async def async_remove_settings(self) -> None:
         """Remove settings."""
+
+        # A pending delayed write must not bring the settings back on unload
+        self.dirty___ = False
         await self.store___.async_remove()
 
     # ------------------------------------------------------------------
@@ -140,6 +271,11 @@ class StorageJson:
         del tmp_dict["store___"]
         del tmp_dict["DICT_KEY___"]
         del tmp_dict["base_class___"]
+        del tmp_dict["write_delay___"]
+        del tmp_dict["dirty___"]
+        del tmp_dict["delayed_extra_data___"]
+        del tmp_dict["write_requests___"]
+        del tmp_dict["writes___"]
 
         if self.write_hidden_attributes___ is False:
             try:
@@ -2,17 +2,14 @@
 
 from __future__ import annotations
 
-from datetime import timedelta
-
 from homeassistant.components.sensor import SensorEntity
 from homeassistant.const import MATCH_ALL
 from homeassistant.core import HomeAssistant, ServiceCall
-from homeassistant.helpers.update_coordinator import DataUpdateCoordinator
 
 from . import CommonConfigEntry
-from .component_api import ComponentApi
-from .const import DOMAIN, LOGGER, TRANSLATION_KEY
+from .const import DOMAIN, TRANSLATION_KEY
 from .entity import ComponentEntity
+from .report_model import ImportantNotice, TrafficSnapshot
 
 
 # ------------------------------------------------------
@@ -32,22 +29,7 @@ class ImportantNoticeLatestSensor(ComponentEntity, SensorEntity):
         self.hass: HomeAssistant = hass
         self.entry: CommonConfigEntry = entry
 
-        super().__init__(
-            DataUpdateCoordinator(
-                hass,
-                LOGGER,
-                name=DOMAIN,
-                update_interval=timedelta(minutes=4),
-                update_method=self.async_refresh,
-                config_entry=entry,
-            ),
-            entry,
-        )
-
-        self.component_api: ComponentApi = entry.runtime_data.component_api
-
-        self.coordinator.update_interval = timedelta(minutes=5)
-        self.coordinator.update_method = self.async_refresh
+        super().__init__(entry.runtime_data.coordinator, entry)
 
         self._name = "Vigtig besked"
         self._unique_id = "vigtig_besked"
@@ -72,7 +54,7 @@ class ImportantNoticeLatestSensor(ComponentEntity, SensorEntity):
     ) -> None:
         """Mark all important notices as read."""
         self.component_api.mark_all_important_notices_as_read()
-        await self.coordinator.async_request_refresh()
+        await self.component_api.async_update_state()
 
     # ------------------------------------------------------------------
     async def async_unmark_all_important_notices_as_read_service(
@@ -80,16 +62,7 @@ class ImportantNoticeLatestSensor(ComponentEntity, SensorEntity):
     ) -> None:
         """Unmark all important notices as read."""
         self.component_api.unmark_all_important_notices_as_read()
-        await self.coordinator.async_request_refresh()
-
-    # ------------------------------------------------------
-    async def async_refresh(self) -> None:
-        """Refresh."""
-        await self.component_api.async_refresh_important_notices()
-
-        await self.component_api.async_important_notice_event_fire()
-
-        self.async_write_ha_state()
+        await self.component_api.async_update_state()
 
     # ------------------------------------------------------
     @property
@@ -103,51 +76,27 @@ class ImportantNoticeLatestSensor(ComponentEntity, SensorEntity):
         return self._name
 
     # ------------------------------------------------------
-    @property
-    def native_value(self) -> str | None:
-        """Native value.
+    def compute_state(self, data: TrafficSnapshot) -> tuple[str | None, dict]:
+        """Compute native value and extra state attributes.
 
         Returns:
-            str | None: Native value
-
-        """
-
-        if len(self.component_api.important_notices) == 0 or (
-            len(self.component_api.important_notices) > 0
-            and self.component_api.important_notices[0]["read"]
-        ):
-            return None
-
-        return self.component_api.important_notices[0]["formated_text"]
-
-    # ------------------------------------------------------
-    @property
-    def extra_state_attributes(self) -> dict:
-        """Extra state attributes.
-
-        Returns:
-            dict: Extra state attributes
+            tuple[str | None, dict]: Native value and extra state attributes
 
         """
 
         attr: dict = {}
 
-        if len(self.component_api.important_notices) == 0 or (
-            len(self.component_api.important_notices) > 0
-            and self.component_api.important_notices[0]["read"]
-        ):
-            return attr
+        if len(data.important_notices) == 0 or data.important_notices[0].read:
+            return None, attr
+
+        tmp_notice: ImportantNotice = data.important_notices[0]
 
-        attr["markdown"] = self.component_api.important_notices[0]["markdown"]
-        attr["oprettet_tidspunkt"] = self.component_api.important_notices[0][
-            "createdTime"
-        ]
-        attr["opdateret_tidspunkt"] = self.component_api.important_notices[0][
-            "updatedTime"
-        ]
-        attr["antal_vigtige_beskeder"] = len(self.component_api.important_notices)
+        attr["markdown"] = tmp_notice.markdown
+        attr["oprettet_tidspunkt"] = tmp_notice.created_time
+        attr["opdateret_tidspunkt"] = tmp_notice.updated_time
+        attr["antal_vigtige_beskeder"] = len(data.important_notices)
 
-        return attr
+        return tmp_notice.formated_text, attr
 
     # ------------------------------------------------------
     @property
@@ -170,7 +119,7 @@ class ImportantNoticeLatestSensor(ComponentEntity, SensorEntity):
     @property
     def available(self) -> bool:
         """Return if entity is available."""
-        return self.coordinator.last_update_success
+        return self.coordinator.last_update_success and self.component_api.has_data
 
     # ------------------------------------------------------
     async def async_update(self) -> None:
@@ -180,7 +129,11 @@ class ImportantNoticeLatestSensor(ComponentEntity, SensorEntity):
     # ------------------------------------------------------
     async def async_added_to_hass(self) -> None:
         """When entity is added to hass."""
-        await self.async_refresh()
         self.async_on_remove(
-            self.coordinator.async_add_listener(self.async_write_ha_state)
+            self.coordinator.async_add_listener(self.async_write_ha_state_if_changed)
+        )
+        self.async_on_remove(
+            self.component_api.async_add_state_listener(
+                self.async_write_ha_state_if_changed
+            )
         )
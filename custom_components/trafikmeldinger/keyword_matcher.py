@@ -0,0 +1,188 @@
+"""Keyword matcher for Trafikmeldinger."""
+
+from __future__ import annotations
+
+from collections import deque
+from re import IGNORECASE, Pattern, compile, escape
+
+from .const import KEYWORD_MATCHER_MIN_WORDS
+
+
+# ------------------------------------------------------------------
+# ------------------------------------------------------------------
+class KeywordMatcher:
+    """Aho-Corasick matcher for many keywords.
+
+    Finds if ANY keyword is present in a text in one pass, with the same
+    case and whole word semantics as the alternation regex.
+    """
+
+    def __init__(
+        self,
+        words: list[str],
+        use_word_boundaries: bool = True,
+        case_sensitive: bool = False,
+    ) -> None:
+        """Init."""
+
+        self.words: list[str] = [word for word in words if word.strip() != ""]
+        self.use_word_boundaries: bool = use_word_boundaries
+        self.case_sensitive: bool = case_sensitive
+
+        self.goto: list[dict[str, int]] = [{}]
+        self.fail: list[int] = [0]
+        self.output: list[tuple[int, ...]] = [()]
+
+        self._regex: Pattern[str] | None = None
+
+        for word in self.words:
+            self._add_word(word if case_sensitive else word.lower())
+
+        self._build_fail_links()
+
+    # ------------------------------------------------------------------
+    def _add_word(self, word: str) -> None:
+        """Add word to the trie."""
+
+        node: int = 0
+
+        for char in word:
+            next_node: int | None = self.goto[node].get(char)
+
+            if next_node is None:
+                next_node = len(self.goto)
+                self.goto[node][char] = next_node
+                self.goto.append({})
+                self.fail.append(0)
+                self.output.append(())
+
+            node = next_node
+
+        self.output[node] = (*self.output[node], len(word))
+
+    # ------------------------------------------------------------------
+    def _build_fail_links(self) -> None:
+        """Build fail links breadth first."""
+
+        queue: deque[int] = deque(self.goto[0].values())
+
+        while queue:
+            node: int = queue.popleft()
+
+            for char, next_node in self.goto[node].items():
+                queue.append(next_node)
+
+                fail_node: int = self.fail[node]
+
+                while fail_node and char not in self.goto[fail_node]:
+                    fail_node = self.fail[fail_node]
+
+                self.fail[next_node] = self.goto[fail_node].get(char, 0)
+                self.output[next_node] = (
+                    *self.output[next_node],
+                    *self.output[self.fail[next_node]],
+                )
+
+    # ------------------------------------------------------------------
+    @staticmethod
+    def _is_word_char(text: str, pos: int) -> bool:
+        """Check if char at pos is a regex word char."""
+
+        return 0 <= pos < len(text) and (text[pos].isalnum() or text[pos] == "_")
+
+    # ------------------------------------------------------------------
+    def _is_boundary(self, text: str, pos: int) -> bool:
+        """Check if pos is a regex word boundary."""
+
+        return self._is_word_char(text, pos - 1) != self._is_word_char(text, pos)
+
+    # ------------------------------------------------------------------
+    def _fallback_search(self, text: str) -> bool:
+        """Search with the alternation regex."""
+
+        if self._regex is None:
+            self._regex = compile_any_word_regex(
+                self.words, self.use_word_boundaries, self.case_sensitive
+            )
+
+        return self._regex.search(text) is not None
+
+    # ------------------------------------------------------------------
+    def search(self, text: str) -> bool:
+        """Check if any keyword is present in text."""
+
+        if not self.case_sensitive:
+            tmp_text: str = text.lower()
+
+            # Lower casing changed positions, so boundaries can not be checked
+            if len(tmp_text) != len(text):
+                return self._fallback_search(text)
+
+            text = tmp_text
+
+        node: int = 0
+
+        for pos, char in enumerate(text):
+            while node and char not in self.goto[node]:
+                node = self.fail[node]
+
+            node = self.goto[node].get(char, 0)
+
+            if not self.output[node]:
+                continue
+
+            if not self.use_word_boundaries:
+                return True
+
+            if not self._is_boundary(text, pos + 1):
+                continue
+
+            for length in self.output[node]:
+                if self._is_boundary(text, pos + 1 - length):
+                    return True
+
+        return False
+
+
+# ------------------------------------------------------------------
+def compile_any_word_regex(
+    words: list[str],
+    use_word_boundaries: bool = True,
+    case_sensitive: bool = False,
+) -> Pattern[str] | None:
+    """Returns a compiled regex pattern that matches if ANY word in the list is present in a text.
+
+    - use_word_boundaries: If True, only matches whole words.
+    - case_sensitive: If False, matches regardless of letter case.
+    """
+
+    if len(words) == 0:
+        return None
+
+    if use_word_boundaries:
+        pattern = r"|".join(
+            rf"\b{escape(word)}\b" for word in words if word.strip() != ""
+        )
+    else:
+        pattern = r"|".join(escape(word) for word in words if word.strip() != "")
+    combined_pattern: str = f"({pattern})"
+    flags: int = 0 if case_sensitive else IGNORECASE
+    return compile(combined_pattern, flags)
+
+
+# ------------------------------------------------------------------
+def compile_any_word_matcher(
+    words: list[str],
+    use_word_boundaries: bool = True,
+    case_sensitive: bool = False,
+) -> Pattern[str] | KeywordMatcher | None:
+    """Compile a matcher for ANY word in the list.
+
+    Large lists use the Aho-Corasick keyword matcher, small ones the
+    alternation regex.
+    """
+
+    if len(words) >= KEYWORD_MATCHER_MIN_WORDS:
+        return KeywordMatcher(words, use_word_boundaries, case_sensitive)
+
+    return compile_any_word_regex(words, use_word_boundaries, case_sensitive)
@@ -0,0 +1,76 @@
+"""Adaptive poll policy for Trafikmeldinger."""
+
+from __future__ import annotations
+
+from datetime import datetime
+
+from .const import (
+    POLL_BURST_NEW_REPORTS,
+    POLL_EMPTY_STREAK,
+    POLL_NIGHT_HOURS,
+    POLL_RUSH_HOURS,
+    UPDATE_INTERVAL_SECONDS,
+)
+
+
+# ------------------------------------------------------------------
+# ------------------------------------------------------------------
+class AdaptivePollPolicy:
+    """Poll interval driven by feed activity and time of day.
+
+    Polls at the floor during bursts of new reports, more often in rush
+    hours, and backs off towards the ceiling at night or after repeated
+    fetches without anything new.
+    """
+
+    def __init__(self) -> None:
+        """Init."""
+
+        self.interval_seconds: float = UPDATE_INTERVAL_SECONDS
+        self.reason: str = "default"
+        self.empty_streak: int = 0
+
+    # ------------------------------------------------------------------
+    def next_interval(
+        self,
+        now: datetime,
+        new_reports: int,
+        floor_seconds: float,
+        ceiling_seconds: float,
+    ) -> float:
+        """Decide the interval until the next poll."""
+
+        if new_reports > 0:
+            self.empty_streak = 0
+        else:
+            self.empty_streak += 1
+
+        interval: float = UPDATE_INTERVAL_SECONDS
+
+        if new_reports >= POLL_BURST_NEW_REPORTS:
+            interval = floor_seconds
+            self.reason = "burst"
+
+        elif now.weekday() < 5 and any(
+            start <= now.hour < end for start, end in POLL_RUSH_HOURS
+        ):
+            interval = UPDATE_INTERVAL_SECONDS / 2
+            self.reason = "rush_hour"
+
+        elif any(start <= now.hour < end for start, end in POLL_NIGHT_HOURS):
+            interval = ceiling_seconds
+            self.reason = "night"
+
+        elif self.empty_streak >= POLL_EMPTY_STREAK:
+            # Double the interval for every empty fetch past the streak
+            interval = UPDATE_INTERVAL_SECONDS * 2 ** min(
+                self.empty_streak - POLL_EMPTY_STREAK + 1, 8
+            )
+            self.reason = "idle"
+
+        else:
+            self.reason = "default"
+
+        self.interval_seconds = max(floor_seconds, min(ceiling_seconds, interval))
+
+        return self.interval_seconds
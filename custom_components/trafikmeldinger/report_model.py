@@ -0,0 +1,224 @@
+"""Report model for Trafikmeldinger."""
+
+from __future__ import annotations
+
+from dataclasses import asdict, dataclass, field
+from datetime import datetime
+from sys import intern
+
+from homeassistant.util import dt as dt_util
+
+
+# ------------------------------------------------------------------
+# ------------------------------------------------------------------
+@dataclass(slots=True)
+class TrafficReportUpdate:
+    """Traffic report update."""
+
+    text: str
+    created_time: str
+    created_ts: float
+
+
+# ------------------------------------------------------------------
+# ------------------------------------------------------------------
+@dataclass(slots=True)
+class TrafficReport:
+    """Traffic report.
+
+    Holds the fields of a DR post used by the integration, with the times
+    converted to local time and pre-parsed to epoch values.
+    """
+
+    id: str
+    text: str
+    reference_text: str
+    region: str
+    type: str
+    created_time: str
+    created_ts: float
+    updated_time: str
+    updated_ts: float
+    concluded: bool = False
+    updates: tuple[TrafficReportUpdate, ...] = ()
+
+    read: bool = False
+    formated_text: str = ""
+    formated_updates_text: list = field(default_factory=list)
+    markdown: str = ""
+
+    # ------------------------------------------------------
+    @classmethod
+    def from_dr(cls, payload: dict) -> TrafficReport:
+        """Create traffic report from a DR post."""
+
+        created: datetime = dt_util.as_local(
+            datetime.fromisoformat(payload["createdTime"])
+        )
+        updated: datetime = dt_util.as_local(
+            datetime.fromisoformat(payload["updatedTime"])
+        )
+
+        updates: list[TrafficReportUpdate] = []
+
+        for tmp_update in payload.get("updates") or []:
+            tmp_created: datetime = dt_util.as_local(
+                datetime.fromisoformat(tmp_update["createdTime"])
+            )
+            updates.append(
+                TrafficReportUpdate(
+                    text=tmp_update["text"],
+                    created_time=tmp_created.isoformat(),
+                    created_ts=tmp_created.timestamp(),
+                )
+            )
+
+        return cls(
+            id=payload["_id"],
+            text=payload["text"],
+            reference_text=(
+                payload["reference"]["text"]
+                if payload.get("reference") is not None
+                else ""
+            ),
+            region=intern(str(payload["region"]).lower().replace("-", "_")),
+            type=intern(str(payload["type"]).lower().replace("-", "_")),
+            created_time=created.isoformat(),
+            created_ts=created.timestamp(),
+            updated_time=updated.isoformat(),
+            updated_ts=updated.timestamp(),
+            concluded=bool(payload.get("concluded", False)),
+            updates=tuple(updates),
+        )
+
+    # ------------------------------------------------------
+    @classmethod
+    def from_dict(cls, data: dict) -> TrafficReport:
+        """Create traffic report from a dict made by to_dict."""
+
+        tmp_data: dict = dict(data)
+        tmp_data["region"] = intern(tmp_data["region"])
+        tmp_data["type"] = intern(tmp_data["type"])
+        tmp_data["updates"] = tuple(
+            TrafficReportUpdate(**tmp_update) for tmp_update in tmp_data["updates"]
+        )
+
+        return cls(**tmp_data)
+
+    # ------------------------------------------------------
+    def to_dict(self) -> dict:
+        """Convert traffic report to a dict."""
+
+        return asdict(self)
+
+    # ------------------------------------------------------
+    def update_from(self, report: TrafficReport) -> None:
+        """Update with the fetched fields of a newer version of the report."""
+
+        self.text = report.text
+        self.reference_text = report.reference_text
+        self.region = report.region
+        self.type = report.type
+        self.created_time = report.created_time
+        self.created_ts = report.created_ts
+        self.updated_time = report.updated_time
+        self.updated_ts = report.updated_ts
+        self.concluded = report.concluded
+        self.updates = report.updates
+
+    # ------------------------------------------------------
+    @property
+    def last_updated_time(self) -> str:
+        """Time of the latest update, or updated time if no updates."""
+
+        if len(self.updates) > 0:
+            return self.updates[0].created_time
+
+        return self.updated_time
+
+
+# ------------------------------------------------------------------
+# ------------------------------------------------------------------
+@dataclass(slots=True)
+class ImportantNotice:
+    """Important notice."""
+
+    id: str
+    text: str
+    created_time: str
+    updated_time: str
+    updated_ts: float
+
+    read: bool = False
+    formated_text: str = ""
+    markdown: str = ""
+
+    # ------------------------------------------------------
+    @classmethod
+    def from_dr(cls, payload: dict) -> ImportantNotice:
+        """Create important notice from a DR notice."""
+
+        return cls(
+            id=payload["_id"],
+            text=payload["text"],
+            created_time=payload["createdTime"],
+            updated_time=payload["updatedTime"],
+            updated_ts=datetime.fromisoformat(payload["updatedTime"]).timestamp(),
+        )
+
+    # ------------------------------------------------------
+    @classmethod
+    def from_dict(cls, data: dict) -> ImportantNotice:
+        """Create important notice from a dict made by to_dict."""
+
+        return cls(**data)
+
+    # ------------------------------------------------------
+    def to_dict(self) -> dict:
+        """Convert important notice to a dict."""
+
+        return asdict(self)
+
+
+# ------------------------------------------------------------------
+# ------------------------------------------------------------------
+@dataclass(frozen=True, slots=True)
+class TrafficSnapshot:
+    """Published state of the cached reports and overview.
+
+    A new snapshot with a higher generation is published, every time the
+    state changes, so entities can skip writes for a generation already
+    written.
+    """
+
+    traffic_reports: tuple[TrafficReport, ...] = ()
+    important_notices: tuple[ImportantNotice, ...] = ()
+    overview_traffic_md: str = ""
+    fetched_ts: float = 0
+    generation: int = 0
+    traffic_report_rotate_pos: int = -1
+    marked_as_read: int = 0
+
+    # ------------------------------------------------------------------
+    def rotating_traffic_report(self) -> TrafficReport | None:
+        """Get rotating traffic report."""
+
+        if not 0 <= self.traffic_report_rotate_pos < len(self.traffic_reports):
+            return None
+
+        return self.traffic_reports[self.traffic_report_rotate_pos]
+
+    # ------------------------------------------------------------------
+    def latest_open_traffic_report(self) -> TrafficReport | None:
+        """Get latest (open) traffic report."""
+
+        if len(self.traffic_reports) == 0:
+            return None
+
+        # Prioritize not concluded
+        if self.traffic_reports[0].concluded:
+            for item in self.traffic_reports:
+                if not item.concluded:
+                    return item
+
+        return self.traffic_reports[0]
@@ -0,0 +1,96 @@
+"""Shadow cache for Trafikmeldinger."""
+
+from __future__ import annotations
+
+from collections import OrderedDict
+
+from .report_model import TrafficReport
+
+
+# ------------------------------------------------------------------
+# ------------------------------------------------------------------
+class ShadowCache:
+    """Bounded cache of fetched traffic reports, that was filtered out.
+
+    Lets changed filter options surface reports without fetching them
+    again. The oldest entries are evicted when the count or the size cap
+    is reached.
+    """
+
+    def __init__(self, max_size: int, max_bytes: int, max_age_seconds: float) -> None:
+        """Init."""
+
+        self.max_size: int = max_size
+        self.max_bytes: int = max_bytes
+        self.max_age_seconds: float = max_age_seconds
+
+        self.reports: OrderedDict[str, TrafficReport] = OrderedDict()
+        self.sizes: dict[str, int] = {}
+        self.bytes: int = 0
+        self.evictions: int = 0
+        self.expirations: int = 0
+
+    # ------------------------------------------------------------------
+    @staticmethod
+    def report_size(report: TrafficReport) -> int:
+        """Approximate size of the text held by a traffic report."""
+
+        return (
+            len(report.text)
+            + len(report.reference_text)
+            + sum(len(update.text) for update in report.updates)
+        )
+
+    # ------------------------------------------------------------------
+    def __len__(self) -> int:
+        """Number of cached reports."""
+
+        return len(self.reports)
+
+    # ------------------------------------------------------------------
+    def put(self, report: TrafficReport) -> None:
+        """Add or replace a traffic report."""
+
+        self.pop(report.id)
+
+        size: int = self.report_size(report)
+        self.reports[report.id] = report
+        self.sizes[report.id] = size
+        self.bytes += size
+
+        while len(self.reports) > self.max_size or (
+            self.bytes > self.max_bytes and len(self.reports) > 1
+        ):
+            self.pop(next(iter(self.reports)))
+            self.evictions += 1
+
+    # ------------------------------------------------------------------
+    def pop(self, report_id: str) -> TrafficReport | None:
+        """Remove and return a traffic report."""
+
+        report: TrafficReport | None = self.reports.pop(report_id, None)
+
+        if report is not None:
+            self.bytes -= self.sizes.pop(report_id)
+
+        return report
+
+    # ------------------------------------------------------------------
+    def expire(self, now: float) -> None:
+        """Remove traffic reports to old to ever be shown."""
+
+        for report_id in [
+            report.id
+            for report in self.reports.values()
+            if report.updated_ts + self.max_age_seconds < now
+        ]:
+            self.pop(report_id)
+            self.expirations += 1
+
+    # ------------------------------------------------------------------
+    def clear(self) -> None:
+        """Remove all traffic reports."""
+
+        self.reports.clear()
+        self.sizes.clear()
+        self.bytes = 0
@@ -8,11 +8,9 @@ from homeassistant.components.sensor import SensorEntity
 from homeassistant.const import MATCH_ALL
 from homeassistant.core import Event, HomeAssistant, ServiceCall, callback
 from homeassistant.helpers import device_registry as dr, issue_registry as ir
-from homeassistant.helpers.update_coordinator import DataUpdateCoordinator
 from homeassistant.util import dt as dt_util
 
 from . import CommonConfigEntry
-from .component_api import ComponentApi
 from .const import (
     CONF_INCL_LATEST_IN_PREVIOUS_TRAFFIC_REPORTS,
     CONF_LISTEN_TO_TIMER_TRIGGER,
@@ -29,6 +27,7 @@ from .const import (
 )
 from .entity import ComponentEntity
 from .hass_util import TimerTrigger, TimerTriggerErrorEnum
+from .report_model import TrafficReport, TrafficSnapshot
 
 
 # ------------------------------------------------------
@@ -49,17 +48,7 @@ class TrafficReportLatestSensor(ComponentEntity, SensorEntity):
         self.hass = hass
         self.entry: CommonConfigEntry = entry
 
-        super().__init__(
-            DataUpdateCoordinator(
-                hass, LOGGER, name=DOMAIN, always_update=False, config_entry=entry
-            ),
-            entry,
-        )
-        self.component_api: ComponentApi = entry.runtime_data.component_api
-
-        self.coordinator.update_interval = timedelta(minutes=2)
-        # self.coordinator.update_interval = timedelta(seconds=20)
-        self.coordinator.update_method = self.async_refresh
+        super().__init__(entry.runtime_data.coordinator, entry)
 
         self._name = "Seneste"
         self._unique_id = "seneste"
@@ -122,8 +111,8 @@ class TrafficReportLatestSensor(ComponentEntity, SensorEntity):
             DOMAIN,
             "rotate_to_next_traffic_report",
         )
-        await self.component_api.storage.async_write_settings()
-        await self.coordinator.async_request_refresh()
+        self.component_api.storage.delay_write_settings()
+        await self.component_api.async_update_state()
 
     # ------------------------------------------------------------------
     async def async_unmark_all_as_read_service(self, call: ServiceCall) -> None:
@@ -139,8 +128,8 @@ class TrafficReportLatestSensor(ComponentEntity, SensorEntity):
             DOMAIN,
             "rotate_to_next_traffic_report",
         )
-        await self.component_api.storage.async_write_settings()
-        await self.coordinator.async_request_refresh()
+        self.component_api.storage.delay_write_settings()
+        await self.component_api.async_update_state()
 
     # ------------------------------------------------------------------
     async def async_mark_all_traffic_reports_as_read_service(
@@ -148,8 +137,8 @@ class TrafficReportLatestSensor(ComponentEntity, SensorEntity):
     ) -> None:
         """Mark all traffic reports as read."""
         self.component_api.mark_all_traffic_reports_as_read()
-        await self.component_api.storage.async_write_settings()
-        await self.coordinator.async_request_refresh()
+        self.component_api.storage.delay_write_settings()
+        await self.component_api.async_update_state()
 
     # ------------------------------------------------------------------
     async def async_unmark_all_traffic_reports_as_read_service(
@@ -157,8 +146,8 @@ class TrafficReportLatestSensor(ComponentEntity, SensorEntity):
     ) -> None:
         """Unmark all traffic reports as read."""
         self.component_api.unmark_all_traffic_reports_as_read()
-        await self.component_api.storage.async_write_settings()
-        await self.coordinator.async_request_refresh()
+        self.component_api.storage.delay_write_settings()
+        await self.component_api.async_update_state()
 
     # ------------------------------------------------------------------
     async def async_mark_latest_traffic_report_as_read_service(
@@ -166,8 +155,8 @@ class TrafficReportLatestSensor(ComponentEntity, SensorEntity):
     ) -> None:
         """Mark latest traffic report as read."""
         self.component_api.mark_traffic_report_as_read(0)
-        await self.component_api.storage.async_write_settings()
-        await self.coordinator.async_request_refresh()
+        self.component_api.storage.delay_write_settings()
+        await self.component_api.async_update_state()
 
     # ------------------------------------------------------------------
     async def async_unmark_latest_traffic_report_as_read_service(
@@ -175,8 +164,8 @@ class TrafficReportLatestSensor(ComponentEntity, SensorEntity):
     ) -> None:
         """Unmark latest traffic report as read."""
         self.component_api.unmark_traffic_report_as_read(0)
-        await self.component_api.storage.async_write_settings()
-        await self.coordinator.async_request_refresh()
+        self.component_api.storage.delay_write_settings()
+        await self.component_api.async_update_state()
 
     # ------------------------------------------------------------------
     async def async_mark_current_traffic_report_as_read_service(
@@ -184,8 +173,8 @@ class TrafficReportLatestSensor(ComponentEntity, SensorEntity):
     ) -> None:
         """Mark latest traffic report as read."""
         self.component_api.mark_current_traffic_report_as_read()
-        await self.component_api.storage.async_write_settings()
-        await self.coordinator.async_request_refresh()
+        self.component_api.storage.delay_write_settings()
+        await self.component_api.async_update_state()
 
     # ------------------------------------------------------------------
     async def async_unmark_current_traffic_report_as_read_service(
@@ -193,15 +182,8 @@ class TrafficReportLatestSensor(ComponentEntity, SensorEntity):
     ) -> None:
         """Unmark latest traffic report as read."""
         self.component_api.unmark_current_traffic_report_as_read()
-        await self.component_api.storage.async_write_settings()
-        await self.coordinator.async_request_refresh()
-
-    # ------------------------------------------------------
-    async def async_refresh(self) -> None:
-        """Refresh."""
-        await self.component_api.async_refresh_traffic_reports()
-
-        self.async_write_ha_state()
+        self.component_api.storage.delay_write_settings()
+        await self.component_api.async_update_state()
 
     # ------------------------------------------------------
     @property
@@ -215,68 +197,43 @@ class TrafficReportLatestSensor(ComponentEntity, SensorEntity):
         return self._name
 
     # ------------------------------------------------------
-    @property
-    def native_value(self) -> str | None:
-        """Native value.
-
-        Returns:
-            str | None: Native value
-
-        """
-
-        if len(self.component_api.traffic_reports) == 0 or (
-            len(self.component_api.traffic_reports) > 0
-            and self.component_api.traffic_reports[0]["read"]
-        ):
-            return None
-
-        tmp_report: dict = self.component_api.get_latest_open_traffic_report()
-
-        return tmp_report.get("formated_text", "")
-
-    # ------------------------------------------------------
-    @property
-    def extra_state_attributes(self) -> dict:
-        """Extra state attributes.
+    def compute_state(self, data: TrafficSnapshot) -> tuple[str | None, dict]:
+        """Compute native value and extra state attributes.
 
         Returns:
-            dict: Extra state attributes
+            tuple[str | None, dict]: Native value and extra state attributes
 
         """
 
         attr: dict = {}
 
-        if (
-            len(self.component_api.traffic_reports) == 0
-            or "formated_updates_text" not in self.component_api.traffic_reports[0]
-            or (
-                len(self.component_api.traffic_reports) > 0
-                and self.component_api.traffic_reports[0]["read"]
-            )
-        ):
-            return attr
+        if len(data.traffic_reports) == 0 or data.traffic_reports[0].read:
+            return None, attr
+
+        tmp_report: TrafficReport = data.latest_open_traffic_report()
 
-        tmp_report: dict = self.component_api.get_latest_open_traffic_report()
+        if not data.traffic_reports[0].markdown:
+            return tmp_report.formated_text, attr
 
-        attr["opdateringer"] = tmp_report["formated_updates_text"]
-        attr["markdown"] = tmp_report["markdown"]
+        attr["opdateringer"] = tmp_report.formated_updates_text
+        attr["markdown"] = tmp_report.markdown
 
-        attr["oversigt_markdown"] = self.component_api.overview_traffic_md
+        attr["oversigt_markdown"] = data.overview_traffic_md
 
-        attr["region"] = DICT_REGION[tmp_report["region"]]
-        attr["transporttype"] = DICT_TRANSPORT_TYPE[tmp_report["type"]]
-        attr["oprettet_tidspunkt"] = tmp_report["createdTime"]
-        attr["opdateret_tidspunkt"] = tmp_report["updatedTime"]
-        attr["afsluttet"] = tmp_report.get("concluded", False)
+        attr["region"] = DICT_REGION[tmp_report.region]
+        attr["transporttype"] = DICT_TRANSPORT_TYPE[tmp_report.type]
+        attr["oprettet_tidspunkt"] = tmp_report.created_time
+        attr["opdateret_tidspunkt"] = tmp_report.updated_time
+        attr["afsluttet"] = tmp_report.concluded
         attr["for_gammel_tidspunkt"] = dt_util.as_local(
-            datetime.fromisoformat(tmp_report["updatedTime"])
+            dt_util.utc_from_timestamp(tmp_report.updated_ts)
             + timedelta(hours=self.entry.options.get(CONF_MAX_TIME_BACK, 0))
         )
 
-        attr["antal_trafikmeldinger"] = len(self.component_api.traffic_reports)
-        attr["markeret_som_læst"] = self.component_api.storage.marked_as_read
+        attr["antal_trafikmeldinger"] = len(data.traffic_reports)
+        attr["markeret_som_læst"] = data.marked_as_read
 
-        return attr
+        return tmp_report.formated_text, attr
 
     # ------------------------------------------------------
     @property
@@ -299,7 +256,7 @@ class TrafficReportLatestSensor(ComponentEntity, SensorEntity):
     @property
     def available(self) -> bool:
         """Return if entity is available."""
-        return self.coordinator.last_update_success
+        return self.coordinator.last_update_success and self.component_api.has_data
 
     # ------------------------------------------------------
     async def async_update(self) -> None:
@@ -310,9 +267,13 @@ class TrafficReportLatestSensor(ComponentEntity, SensorEntity):
     async def async_added_to_hass(self) -> None:
         """When entity is added to hass."""
 
-        await self.async_refresh()
         self.async_on_remove(
-            self.coordinator.async_add_listener(self.async_write_ha_state)
+            self.coordinator.async_add_listener(self.async_write_ha_state_if_changed)
+        )
+        self.async_on_remove(
+            self.component_api.async_add_state_listener(
+                self.async_write_ha_state_if_changed
+            )
         )
 
         self.hass.bus.async_listen(
@@ -329,6 +290,7 @@ class TrafficReportLatestSensor(ComponentEntity, SensorEntity):
 
         if event.data["action"] == "remove":
             await self.component_api.storage.async_remove_settings()
+            await self.component_api.snapshot_storage.async_remove_settings()
 
 
 # ------------------------------------------------------
@@ -349,18 +311,7 @@ class TrafficReportRotateSensor(ComponentEntity, SensorEntity):
         self.hass: HomeAssistant = hass
         self.entry: CommonConfigEntry = entry
 
-        super().__init__(
-            DataUpdateCoordinator(
-                hass,
-                LOGGER,
-                name=DOMAIN,
-                config_entry=entry,
-            ),
-            entry,
-        )
-        self.coordinator.update_method = self.async_refresh_dummy
-
-        self.component_api: ComponentApi = entry.runtime_data.component_api
+        super().__init__(entry.runtime_data.coordinator, entry)
 
         self._name = "Roterende"
         self._unique_id = "roterende"
@@ -370,6 +321,7 @@ class TrafficReportRotateSensor(ComponentEntity, SensorEntity):
             if entry.options.get(CONF_INCL_LATEST_IN_PREVIOUS_TRAFFIC_REPORTS, False)
             else 1
         )
+        self.component_api.traffic_report_rotate_start_pos = self.start_pos
 
         self.translation_key = TRANSLATION_KEY
 
@@ -393,14 +345,32 @@ class TrafficReportRotateSensor(ComponentEntity, SensorEntity):
     async def async_rotate_to_next_traffic_report_service(
         self, call: ServiceCall
     ) -> None:
-        """Mark all as read."""
-        self.component_api.get_next_traffic_report_pos(self.start_pos)
-        await self.coordinator.async_request_refresh()
+        """Rotate to next traffic report."""
+        await self.component_api.async_update_state(rotate=True)
 
     # ------------------------------------------------------
-    async def async_refresh_dummy(self) -> None:
-        """Refresh."""
-        await self.async_refresh(False)
+    def async_apply_options(self) -> None:
+        """Apply changed options, without a reload."""
+
+        self.start_pos = (
+            0
+            if self.entry.options.get(
+                CONF_INCL_LATEST_IN_PREVIOUS_TRAFFIC_REPORTS, False
+            )
+            else 1
+        )
+        self.component_api.traffic_report_rotate_start_pos = self.start_pos
+
+        duration: timedelta = timedelta(
+            minutes=self.entry.options.get(CONF_ROTATE_EVERY_MINUTES, 0.5)
+        )
+
+        if duration != self.timer_trigger.duration:
+            self.timer_trigger.duration = duration
+
+            # Only running, when not listening to a timer helper
+            if self.timer_trigger.point_in_UTC_time_trigger is not None:
+                self.timer_trigger.point_in_UTC_time_trigger.start(duration=duration)
 
     # ------------------------------------------------------
     async def async_refresh(self, error: TimerTriggerErrorEnum) -> None:
@@ -430,9 +400,7 @@ class TrafficReportRotateSensor(ComponentEntity, SensorEntity):
                     pass
             return
 
-        self.component_api.get_next_traffic_report_pos(self.start_pos)
-        await self.component_api.async_create_overview_traffic_md()
-        self.async_write_ha_state()
+        await self.component_api.async_update_state(rotate=True)
 
     # ------------------------------------------------------
     @property
@@ -446,65 +414,40 @@ class TrafficReportRotateSensor(ComponentEntity, SensorEntity):
         return self._name
 
     # ------------------------------------------------------
-    @property
-    def native_value(self) -> str | None:
-        """Native value.
-
-        Returns:
-            str | None: Native value
-
-        """
-
-        if (
-            self.component_api.traffic_report_rotate_pos == -1
-            or len(self.component_api.traffic_reports) == 0
-        ):
-            return None
-
-        tmp_report: dict = self.component_api.get_rotating_traffic_report()
-
-        return tmp_report.get("formated_text", "")
-
-    # ------------------------------------------------------
-    @property
-    def extra_state_attributes(self) -> dict:
-        """Extra state attributes.
+    def compute_state(self, data: TrafficSnapshot) -> tuple[str | None, dict]:
+        """Compute native value and extra state attributes.
 
         Returns:
-            dict: Extra state attributes
+            tuple[str | None, dict]: Native value and extra state attributes
 
         """
 
         attr: dict = {}
 
-        if (
-            self.component_api.traffic_report_rotate_pos == -1
-            or len(self.component_api.traffic_reports) == 0
-            or "formated_updates_text"
-            not in self.component_api.traffic_reports[
-                self.component_api.traffic_report_rotate_pos
-            ]
-        ):
-            return attr
+        tmp_report: TrafficReport | None = data.rotating_traffic_report()
 
-        tmp_report: dict = self.component_api.get_rotating_traffic_report()
+        if tmp_report is None:
+            return None, attr
 
-        attr["opdateringer"] = tmp_report["formated_updates_text"]
+        if not tmp_report.markdown:
+            return tmp_report.formated_text, attr
 
-        attr["markdown"] = tmp_report["markdown"]
+        attr["opdateringer"] = tmp_report.formated_updates_text
 
-        attr["oversigt_markdown"] = self.component_api.overview_traffic_md
+        attr["markdown"] = tmp_report.markdown
 
-        attr["region"] = DICT_REGION[tmp_report["region"]]
+        attr["oversigt_markdown"] = data.overview_traffic_md
 
-        attr["transporttype"] = DICT_TRANSPORT_TYPE[tmp_report["type"]]
-        attr["oprettet_tidspunkt"] = tmp_report["createdTime"]
-        attr["opdateret_tidspunkt"] = tmp_report["updatedTime"]
+        attr["region"] = DICT_REGION[tmp_report.region]
 
-        attr["antal_trafikmeldinger"] = len(self.component_api.traffic_reports)
-        attr["markeret_som_læst"] = self.component_api.storage.marked_as_read
+        attr["transporttype"] = DICT_TRANSPORT_TYPE[tmp_report.type]
+        attr["oprettet_tidspunkt"] = tmp_report.created_time
+        attr["opdateret_tidspunkt"] = tmp_report.updated_time
 
-        return attr
+        attr["antal_trafikmeldinger"] = len(data.traffic_reports)
+        attr["markeret_som_læst"] = data.marked_as_read
+
+        return tmp_report.formated_text, attr
 
     # ------------------------------------------------------
     @property
@@ -527,7 +470,7 @@ class TrafficReportRotateSensor(ComponentEntity, SensorEntity):
     @property
     def available(self) -> bool:
         """Return if entity is available."""
-        return self.coordinator.last_update_success
+        return self.coordinator.last_update_success and self.component_api.has_data
 
     # ------------------------------------------------------
     async def async_update(self) -> None:
@@ -539,5 +482,13 @@ class TrafficReportRotateSensor(ComponentEntity, SensorEntity):
         """When entity is added to hass."""
         await self.async_refresh(False)
         self.async_on_remove(
-            self.coordinator.async_add_listener(self.async_write_ha_state)
+            self.coordinator.async_add_listener(self.async_write_ha_state_if_changed)
+        )
+        self.async_on_remove(
+            self.component_api.async_add_state_listener(
+                self.async_write_ha_state_if_changed
+            )
+        )
+        self.async_on_remove(
+            self.component_api.async_add_options_listener(self.async_apply_options)
         )
@@ -0,0 +1,245 @@
+"""Stress test of the traffic report list against concurrent readers.
+
+Interleaves rotation, refreshes, expiry and mark as read services, and checks
+on every published state, that no reader sees a partially merged, sorted,
+trimmed or rendered list.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from datetime import datetime, timedelta
+from random import Random
+from types import MappingProxyType
+
+import pytest
+
+from custom_components.trafikmeldinger.component_api import ComponentApi
+from custom_components.trafikmeldinger.const import (
+    CONF_MAX_ROW_FETCH,
+    CONF_MAX_TIME_BACK,
+    CONF_REGION,
+    CONF_REGION_ALL,
+    CONF_TRANSPORT_TYPE,
+    CONF_TRANSPORT_TYPE_ALL,
+    DOMAIN,
+)
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import HomeAssistant
+from homeassistant.util import dt as dt_util
+
+REFRESHES = 40
+MAX_ROW_FETCH = 15
+MAX_TIME_BACK = 12
+
+
+# ------------------------------------------------------------------
+class FakePosts:
+    """Pages of DR posts, with new and updated posts on every refresh.
+
+    The clock starts 6 hours back and stays hours in the past, within max
+    time back. Posts concluded by an update are past the concluded max time
+    back, so they expire.
+    """
+
+    def __init__(self, seed: int) -> None:
+        """Init."""
+
+        self.random: Random = Random(seed)
+        self.now: datetime = dt_util.utcnow() - timedelta(hours=6)
+        self.next_id: int = 0
+        self.posts: list[dict] = [self.post() for _ in range(10)]
+        self.posts.reverse()
+
+    # ------------------------------------------------------------------
+    def post(self) -> dict:
+        """New DR post."""
+
+        self.now += timedelta(seconds=30)
+        self.next_id += 1
+
+        return {
+            "_id": f"post-{self.next_id}",
+            "text": f"Trafikmelding {self.next_id} ved afkørsel {self.next_id % 7}",
+            "reference": None,
+            "region": self.random.choice(["CPH", "MID-NORTH", "SOUTH"]),
+            "type": self.random.choice(["PUBLIC", "PRIVATE"]),
+            "createdTime": self.now.isoformat(),
+            "updatedTime": self.now.isoformat(),
+            "concluded": False,
+            "updates": [],
+        }
+
+    # ------------------------------------------------------------------
+    def refresh(self) -> None:
+        """Add new posts and update some of the existing ones."""
+
+        self.posts.extend(self.post() for _ in range(self.random.randint(0, 4)))
+
+        for post in self.random.sample(self.posts, min(3, len(self.posts))):
+            self.now += timedelta(seconds=30)
+            post["updatedTime"] = self.now.isoformat()
+            post["updates"] = [
+                {
+                    "text": f"Opdatering {len(post['updates']) + 1}",
+                    "createdTime": post["updatedTime"],
+                },
+                *post["updates"],
+            ]
+            post["concluded"] = self.random.random() < 0.2
+
+        self.posts.sort(key=lambda post: post["updatedTime"], reverse=True)
+
+    # ------------------------------------------------------------------
+    async def async_get(self, url: str, conditional: bool = False) -> list:
+        """Page of posts older than lastPostDate, yielding like a fetch."""
+
+        await asyncio.sleep(0)
+
+        last_post_date: str = url.rsplit("lastPostDate=", 1)[1]
+        posts: list[dict] = [
+            post
+            for post in self.posts
+            if last_post_date == "" or post["createdTime"] < last_post_date
+        ]
+        posts.sort(key=lambda post: post["createdTime"], reverse=True)
+
+        await asyncio.sleep(0)
+
+        return posts[:5]
+
+
+# ------------------------------------------------------------------
+def check_state(component_api: ComponentApi) -> None:
+    """Check the state seen by readers is complete and consistent."""
+
+    reports = component_api.traffic_reports
+
+    assert len(reports) == len(component_api.traffic_reports_index)
+    assert all(
+        component_api.traffic_reports_index[report.id] is report for report in reports
+    )
+    assert len(reports) <= MAX_ROW_FETCH
+    assert all(report.markdown and report.formated_text for report in reports)
+    assert all(
+        reports[idx].updated_ts >= reports[idx + 1].updated_ts
+        for idx in range(len(reports) - 1)
+    )
+    assert component_api.unread_positions == [
+        idx for idx, report in enumerate(reports) if not report.read
+    ]
+    assert -1 <= component_api.traffic_report_rotate_pos < max(len(reports), 1)
+
+
+# ------------------------------------------------------------------
+def check_published(component_api: ComponentApi) -> None:
+    """Check the published rotation points at an unread report, if any."""
+
+    check_state(component_api)
+
+    if component_api.traffic_report_rotate_pos == -1:
+        assert component_api.unread_positions == []
+    else:
+        assert not component_api.traffic_reports[
+            component_api.traffic_report_rotate_pos
+        ].read
+
+
+# ------------------------------------------------------------------
+@pytest.mark.asyncio
+async def test_rotation_refresh_and_services_interleaved(tmp_path) -> None:
+    """Rotate and mark as read, while refreshes swap in new lists."""
+
+    hass: HomeAssistant = HomeAssistant(str(tmp_path))
+    entry: ConfigEntry = ConfigEntry(
+        data={},
+        discovery_keys=MappingProxyType({}),
+        domain=DOMAIN,
+        minor_version=1,
+        options={
+            CONF_REGION: [CONF_REGION_ALL],
+            CONF_TRANSPORT_TYPE: [CONF_TRANSPORT_TYPE_ALL],
+            CONF_MAX_ROW_FETCH: MAX_ROW_FETCH,
+            CONF_MAX_TIME_BACK: MAX_TIME_BACK,
+        },
+        source="user",
+        subentries_data=None,
+        title=DOMAIN,
+        unique_id=None,
+        version=1,
+    )
+    component_api: ComponentApi = ComponentApi(hass, entry, None)
+    posts: FakePosts = FakePosts(seed=1)
+    component_api.async_get_json = posts.async_get
+
+    expiries: int = 0
+    remove_to_old_traffic_reports = component_api.async_remove_to_old_traffic_reports
+
+    async def _async_remove_to_old_traffic_reports() -> bool:
+        nonlocal expiries
+
+        if await remove_to_old_traffic_reports():
+            expiries += 1
+            return True
+
+        return False
+
+    component_api.async_remove_to_old_traffic_reports = (
+        _async_remove_to_old_traffic_reports
+    )
+
+    published: list[int] = []
+
+    def _on_publish() -> None:
+        check_published(component_api)
+        published.append(component_api.generation)
+
+    component_api.async_add_state_listener(_on_publish)
+
+    refreshing: bool = True
+    random: Random = Random(2)
+
+    async def _refresh() -> None:
+        nonlocal refreshing
+
+        for _ in range(REFRESHES):
+            posts.refresh()
+            await component_api.async_refresh_traffic_reports()
+            check_state(component_api)
+            assert len(component_api.traffic_reports) > 0
+            await asyncio.sleep(0)
+
+        refreshing = False
+
+    # The rotate every 0.25 minutes timer, without waiting for the timer
+    async def _rotate() -> None:
+        while refreshing:
+            await component_api.async_update_state(rotate=True)
+            await asyncio.sleep(0)
+
+    async def _expire() -> None:
+        while refreshing:
+            await component_api.async_handle_expiry(dt_util.utcnow())
+            await asyncio.sleep(0)
+
+    async def _services() -> None:
+        while refreshing:
+            if random.random() < 0.5:
+                component_api.mark_current_traffic_report_as_read()
+            else:
+                component_api.unmark_traffic_report_as_read(
+                    random.randrange(MAX_ROW_FETCH)
+                )
+
+            await component_api.async_update_state()
+            await asyncio.sleep(0)
+
+    try:
+        await asyncio.gather(_refresh(), _rotate(), _expire(), _services())
+    finally:
+        await hass.async_stop(force=True)
+
+    assert len(component_api.traffic_reports) > 0
+    assert expiries > 0
+    assert len(published) > REFRESHES
+    assert published == sorted(published)